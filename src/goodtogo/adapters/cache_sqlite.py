@@ -13,6 +13,8 @@ Security features:
 
 from __future__ import annotations
 
+import contextlib
+import os
 import sqlite3
 import stat
 import warnings
@@ -95,50 +97,68 @@ class SqliteCacheAdapter(CachePort):
     def _ensure_secure_path(self) -> None:
         """Ensure cache directory and file have secure permissions.
 
-        Creates the directory with 0700 permissions and ensures the file
-        (if it exists) has 0600 permissions. Issues a warning if existing
-        permissions were too permissive.
+        Creates the directory with 0700 permissions and the file with 0600
+        permissions, or ensures an existing file has 0600 permissions.
+        Issues a warning if existing permissions were too permissive.
         """
         path = Path(self.db_path)
         cache_dir = path.parent
 
-        # Create directory with secure permissions if needed
-        if cache_dir and not cache_dir.exists():
-            cache_dir.mkdir(parents=True, mode=0o700, exist_ok=True)
-        elif cache_dir and cache_dir.exists():
-            # Ensure existing directory has correct permissions
-            current_mode = stat.S_IMODE(cache_dir.stat().st_mode)
-            if current_mode != 0o700:
-                cache_dir.chmod(0o700)
+        # Create directory with secure permissions if needed. A single stat
+        # both checks existence and reads the mode of an existing directory.
+        if cache_dir:
+            try:
+                dir_mode = stat.S_IMODE(cache_dir.stat().st_mode)
+            except FileNotFoundError:
+                # Create each missing directory, outermost first, as 0700 and
+                # chmod it explicitly, since mkdir's mode is masked by the
+                # umask. The umask itself is process-wide, so it is not
+                # touched: other threads may be creating files meanwhile.
+                missing = [cache_dir]
+                while not missing[-1].parent.exists():
+                    missing.append(missing[-1].parent)
+                for directory in reversed(missing):
+                    with contextlib.suppress(FileExistsError):
+                        os.mkdir(directory, 0o700)
+                    os.chmod(directory, 0o700)
+            else:
+                # Ensure existing directory has correct permissions
+                if dir_mode != 0o700:
+                    cache_dir.chmod(0o700)
+
+        # Create a missing file with 0600 in the same syscall, so it is never
+        # briefly readable by others; an existing file is checked instead
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o600)
+        except FileExistsError:
+            pass
+        else:
+            os.close(fd)
+            return
 
         # Check existing file permissions and fix if necessary
-        if path.exists():
-            current_mode = stat.S_IMODE(path.stat().st_mode)
-            # Check if group or others have any permissions
-            if current_mode & (stat.S_IRWXG | stat.S_IRWXO):
-                warnings.warn(
-                    f"Cache file {self.db_path} had permissive permissions "
-                    f"({oct(current_mode)}). Fixing to 0600.",
-                    UserWarning,
-                    stacklevel=2,
-                )
-                path.chmod(stat.S_IRUSR | stat.S_IWUSR)
+        current_mode = stat.S_IMODE(path.stat().st_mode)
+        # Check if group or others have any permissions
+        if current_mode & (stat.S_IRWXG | stat.S_IRWXO):
+            warnings.warn(
+                f"Cache file {self.db_path} had permissive permissions "
+                f"({oct(current_mode)}). Fixing to 0600.",
+                UserWarning,
+                stacklevel=2,
+            )
+            path.chmod(stat.S_IRUSR | stat.S_IWUSR)
 
     def _init_database(self) -> None:
         """Initialize the database schema.
 
         Creates the pr_cache and cache_stats tables if they don't exist.
-        Sets file permissions to 0600 after creation.
+        The file itself was already created with 0600 permissions by
+        _ensure_secure_path().
         """
         conn = self._get_connection()
         conn.executescript(_CREATE_TABLES_SQL)
         conn.commit()
 
-        # Ensure file has correct permissions after creation
-        path = Path(self.db_path)
-        if path.exists():
-            path.chmod(stat.S_IRUSR | stat.S_IWUSR)
-
     def _get_connection(self) -> sqlite3.Connection:
         """Get or create a database connection.
 
@@ -16,7 +16,7 @@ The analyzer follows the decision tree from the design specification:
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING, Any, Optional, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, cast
 
 from goodtogo.core.errors import redact_error
 from goodtogo.core.models import (
@@ -53,6 +53,34 @@ CACHE_TTL_STABLE_THREAD = 86400  # 24 hours for resolved threads
 CACHE_TTL_STABLE_COMMENT = 86400  # 24 hours for NON_ACTIONABLE comments
 
 
+class CommitInfo(NamedTuple):
+    """Flattened view of the fields the analyzer reads from a commit.
+
+    Built once per analysis by _normalize_commit() so downstream code
+    reads tuple fields instead of walking the nested GitHub commit JSON.
+    Missing values are normalized to empty strings.
+    """
+
+    committer_date: str
+    author_date: str
+
+
+def _normalize_commit(commit_data: dict[str, Any]) -> CommitInfo:
+    """Extract the timestamps from a GitHub commit response.
+
+    Args:
+        commit_data: Raw commit dictionary from GitHubPort.get_commit().
+
+    Returns:
+        CommitInfo with the committer date and author date.
+    """
+    commit = commit_data.get("commit") or {}
+    return CommitInfo(
+        committer_date=(commit.get("committer") or {}).get("date") or "",
+        author_date=(commit.get("author") or {}).get("date") or "",
+    )
+
+
 class PRAnalyzer:
     """Main orchestrator for PR analysis.
 
@@ -152,15 +180,12 @@ class PRAnalyzer:
             head_sha = pr_data.get("head", {}).get("sha", "")
 
             # Fetch the actual commit timestamp from the commit API
-            commit_data = self._get_commit(owner, repo, head_sha)
-            # The commit timestamp is in commit.committer.date (when it was committed)
-            head_timestamp = commit_data.get("commit", {}).get("committer", {}).get("date", "")
-            if not head_timestamp:
-                # Fallback to author date if committer date not available
-                head_timestamp = commit_data.get("commit", {}).get("author", {}).get("date", "")
-            if not head_timestamp:
-                # Final fallback to PR updated_at
-                head_timestamp = pr_data.get("updated_at", "")
+            commit = _normalize_commit(self._get_commit(owner, repo, head_sha))
+            # Prefer the committer date (when it was committed), then the
+            # author date, then the PR's updated_at as a final fallback
+            head_timestamp = (
+                commit.committer_date or commit.author_date or pr_data.get("updated_at", "")
+            )
 
             # Step 3: Check for new commits and invalidate cache if needed
             self._check_and_invalidate_cache(owner, repo, pr_number, head_sha)
@@ -10,6 +10,25 @@ from __future__ import annotations
 import re
 from typing import Optional
 
+# (pattern, replacement) pairs applied in order by redact_error()
+REDACTION_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = (
+    # Redact GitHub tokens (ghp_, gho_, github_pat_)
+    # Pattern: prefix followed by alphanumeric characters and underscores
+    (re.compile(r"(ghp_|gho_|github_pat_)[a-zA-Z0-9_]+"), "<REDACTED_TOKEN>"),
+    # Redact URL credentials (://user:pass@host)
+    # Pattern: :// followed by non-colon chars, colon, non-@ chars, @
+    (re.compile(r"://[^:]+:[^@]+@"), "://<REDACTED>@"),
+    # Redact Authorization headers
+    # Pattern: Authorization (with optional quotes/colons) followed by Bearer/token and the value
+    (
+        re.compile(
+            r'(Authorization["\']?\s*:\s*["\']?)(Bearer\s+)?[a-zA-Z0-9_-]+',
+            re.IGNORECASE,
+        ),
+        r"\1<REDACTED>",
+    ),
+)
+
 
 class RedactedError(Exception):
     """Exception with sensitive data redacted from the message.
@@ -29,6 +48,10 @@ class RedactedError(Exception):
         Exception('Failed with token ghp_secret123')
     """
 
+    # Storing ``original`` in a slot means BaseException's lazily created
+    # instance ``__dict__`` is never allocated.
+    __slots__ = ("original",)
+
     def __init__(self, message: str, original: Optional[Exception] = None) -> None:
         """Initialize a RedactedError.
 
@@ -39,6 +62,10 @@ class RedactedError(Exception):
         self.original = original
         super().__init__(message)
 
+    def __reduce__(self) -> tuple[type[RedactedError], tuple[str, Optional[Exception]]]:
+        """Pickle ``original`` explicitly; BaseException only pickles args and __dict__."""
+        return (type(self), (str(self), self.original))
+
 
 def redact_error(error: Exception) -> RedactedError:
     """Redact sensitive information from an exception's error message.
@@ -71,30 +98,7 @@ def redact_error(error: Exception) -> RedactedError:
         True
     """
     message = str(error)
-
-    # Redact GitHub tokens (ghp_, gho_, github_pat_)
-    # Pattern: prefix followed by alphanumeric characters and underscores
-    message = re.sub(
-        r"(ghp_|gho_|github_pat_)[a-zA-Z0-9_]+",
-        "<REDACTED_TOKEN>",
-        message,
-    )
-
-    # Redact URL credentials (://user:pass@host)
-    # Pattern: :// followed by non-colon chars, colon, non-@ chars, @
-    message = re.sub(
-        r"://[^:]+:[^@]+@",
-        "://<REDACTED>@",
-        message,
-    )
-
-    # Redact Authorization headers
-    # Pattern: Authorization (with optional quotes/colons) followed by Bearer/token and the value
-    message = re.sub(
-        r'(Authorization["\']?\s*:\s*["\']?)(Bearer\s+)?[a-zA-Z0-9_-]+',
-        r"\1<REDACTED>",
-        message,
-        flags=re.IGNORECASE,
-    )
+    for pattern, replacement in REDACTION_PATTERNS:
+        message = pattern.sub(replacement, message)
 
     return RedactedError(message, original=error)
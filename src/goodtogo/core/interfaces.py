@@ -11,15 +11,13 @@ interfaces ensure the core domain has no external dependencies.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Optional
 
+from goodtogo.core.models import CommentClassification, Priority
+
 if TYPE_CHECKING:
-    from goodtogo.core.models import (
-        CacheStats,
-        CommentClassification,
-        Priority,
-        ReviewerType,
-    )
+    from goodtogo.core.models import CacheStats, ReviewerType
 
 
 class GitHubPort(ABC):
@@ -355,6 +353,13 @@ class ReviewerParser(ABC):
     delegates to _parse_impl() for parser-specific classification logic.
     """
 
+    # Parsers hold no per-instance state; subclasses that also declare
+    # empty __slots__ carry no instance __dict__ at all.
+    __slots__ = ()
+
+    # Shared result for resolved and outdated threads
+    _CLOSED_THREAD_RESULT = (CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False)
+
     @property
     @abstractmethod
     def reviewer_type(self) -> ReviewerType:
@@ -415,21 +420,33 @@ class ReviewerParser(ABC):
               could not be definitively classified and needs human
               review (always True for AMBIGUOUS classification)
         """
-        # Import here to avoid circular imports
-        from goodtogo.core.models import CommentClassification, Priority
-
-        # Check if thread is resolved - resolved threads are non-actionable
-        # regardless of severity markers in the original comment text
-        if comment.get("is_resolved", False):
-            return (CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False)
-
-        # Check if thread is outdated - code has changed since comment
-        if comment.get("is_outdated", False):
-            return (CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False)
+        # Resolved threads are non-actionable regardless of severity markers
+        # in the original comment text; outdated threads are non-actionable
+        # because the code has changed since the comment. Both yield the
+        # same result, so one short-circuiting check covers them.
+        if comment.get("is_resolved") or comment.get("is_outdated"):
+            return self._CLOSED_THREAD_RESULT
 
         # Delegate to parser-specific implementation
         return self._parse_impl(comment)
 
+    def parse_many(
+        self, comments: Iterable[dict]
+    ) -> list[tuple[CommentClassification, Priority, bool]]:
+        """Parse a batch of comments, preserving their order.
+
+        Equivalent to calling parse() on each comment in turn; parsers
+        that can share work across a batch may override it.
+
+        Args:
+            comments: Comment dictionaries, as accepted by parse().
+
+        Returns:
+            One (classification, priority, requires_investigation) tuple
+            per comment, in input order.
+        """
+        return [self.parse(comment) for comment in comments]
+
     @abstractmethod
     def _parse_impl(self, comment: dict) -> tuple[CommentClassification, Priority, bool]:
         """Parser-specific classification logic.
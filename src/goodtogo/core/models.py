@@ -10,7 +10,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PRStatus(str, Enum):
@@ -100,13 +100,39 @@ class ReviewerType(str, Enum):
     """Unknown reviewer type."""
 
 
+class ReviewState(str, Enum):
+    """GitHub review state.
+
+    The fixed set of states GitHub reports for a submitted review.
+    """
+
+    APPROVED = "APPROVED"
+    """Reviewer approved the changes."""
+
+    CHANGES_REQUESTED = "CHANGES_REQUESTED"
+    """Reviewer requested changes before merge."""
+
+    COMMENTED = "COMMENTED"
+    """Reviewer left comments without an explicit verdict."""
+
+    DISMISSED = "DISMISSED"
+    """Review was dismissed."""
+
+    PENDING = "PENDING"
+    """Review has been started but not yet submitted."""
+
+
 class Review(BaseModel):
     """PR review with timestamp information.
 
     Represents a review submitted on a PR, including the submission
     timestamp for detecting new reviews after the latest commit.
+    Reviews are immutable snapshots of GitHub data, so the model is
+    frozen and rejects unknown fields.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     """Unique identifier for the review."""
 
@@ -116,7 +142,7 @@ class Review(BaseModel):
     submitted_at: str
     """ISO 8601 timestamp when the review was submitted."""
 
-    state: str
+    state: ReviewState
     """Review state: APPROVED, CHANGES_REQUESTED, COMMENTED, DISMISSED, or PENDING."""
 
     body: Optional[str] = None
@@ -16,7 +16,8 @@ import re
 # GitHub identifier pattern: alphanumeric, dots, hyphens, underscores
 # Must start and end with alphanumeric
 # Maximum length is 39 characters (GitHub's limit)
-GITHUB_ID_PATTERN = re.compile(r"^[a-zA-Z0-9]([a-zA-Z0-9._-]{0,37}[a-zA-Z0-9])?$")
+# Used with fullmatch(): "$" alone would also accept a trailing newline
+GITHUB_ID_PATTERN = re.compile(r"[a-zA-Z0-9]([a-zA-Z0-9._-]{0,37}[a-zA-Z0-9])?", re.ASCII)
 
 
 def validate_github_identifier(value: str, field_name: str) -> str:
@@ -54,7 +55,7 @@ def validate_github_identifier(value: str, field_name: str) -> str:
     if len(value) > 39:  # GitHub max length
         raise ValueError(f"{field_name} exceeds maximum length (39 chars)")
 
-    if not GITHUB_ID_PATTERN.match(value):
+    if not GITHUB_ID_PATTERN.fullmatch(value):
         raise ValueError(
             f"{field_name} contains invalid characters. "
             "Must be alphanumeric with ._- allowed, "
@@ -88,11 +89,35 @@ def validate_pr_number(value: int) -> int:
             ...
         ValueError: PR number must be positive
     """
+    if 0 < value <= 2147483647:  # Max int32
+        return value
     if value <= 0:
         raise ValueError("PR number must be positive")
-    if value > 2147483647:  # Max int32
-        raise ValueError("PR number exceeds maximum value")
-    return value
+    raise ValueError("PR number exceeds maximum value")
+
+
+def _validate_cache_key_part(part: str) -> str:
+    """Validate a single stringified cache key part.
+
+    build_cache_key() calls this only after the joined-key scan has found
+    a problem, to raise an error naming the offending part. It is not on
+    the path for valid keys.
+
+    Args:
+        part: The cache key part, already converted to str.
+
+    Returns:
+        The part, unchanged.
+
+    Raises:
+        ValueError: If the part is empty or contains a colon, asterisk,
+                   or question mark.
+    """
+    if not part:
+        raise ValueError("Cache key parts cannot be empty")
+    if ":" in part or "*" in part or "?" in part:
+        raise ValueError(f"Invalid character in cache key part: {part}")
+    return part
 
 
 def build_cache_key(*parts: str) -> str:
@@ -133,12 +158,21 @@ def build_cache_key(*parts: str) -> str:
             ...
         ValueError: Invalid character in cache key part: my:org
     """
-    # Double-check no special characters that could cause issues
-    for part in parts:
-        str_part = str(part)
-        if not str_part:
-            raise ValueError("Cache key parts cannot be empty")
-        if ":" in str_part or "*" in str_part or "?" in str_part:
-            raise ValueError(f"Invalid character in cache key part: {part}")
-
-    return ":".join(str(p) for p in parts)
+    str_parts = [str(part) for part in parts]
+    key = ":".join(str_parts)
+
+    # Double-check no special characters that could cause issues. Scan the
+    # joined key once; a clean key has exactly one colon between each part.
+    if (
+        all(str_parts)
+        and key.count(":") == len(str_parts) - 1
+        and "*" not in key
+        and "?" not in key
+    ):
+        return key
+
+    # Re-check part by part to report which one is invalid (only an empty
+    # parts list gets through here without raising)
+    for str_part in str_parts:
+        _validate_cache_key_part(str_part)
+    return key
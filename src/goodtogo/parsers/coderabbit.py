@@ -13,6 +13,7 @@ CodeRabbit uses specific patterns to indicate comment severity and type:
 
 from __future__ import annotations
 
+import functools
 import re
 
 from goodtogo.core.interfaces import ReviewerParser
@@ -49,61 +50,96 @@ class CodeRabbitParser(ReviewerParser):
     # Author pattern for CodeRabbit bot
     CODERABBIT_AUTHOR = "coderabbitai[bot]"
 
-    # Body pattern for CodeRabbit signature (fallback detection)
-    CODERABBIT_SIGNATURE_PATTERN = re.compile(
-        r"<!-- This is an auto-generated comment.*by coderabbit\.ai -->",
-        re.IGNORECASE | re.DOTALL,
-    )
+    # Body signature for CodeRabbit (fallback detection), matched as two
+    # casefolded literals with anything in between:
+    # <!-- This is an auto-generated comment ... by coderabbit.ai -->
+    CODERABBIT_SIGNATURE_START = "<!-- this is an auto-generated comment"
+    CODERABBIT_SIGNATURE_END = "by coderabbit.ai -->"
+
+    # Severity emoji (red and orange circles). Each occurs only in its own
+    # severity marker, so a plain substring test rejects bodies cheaply.
+    CRITICAL_EMOJI = "\U0001f534"
+    MAJOR_EMOJI = "\U0001f7e0"
+
+    # Case-insensitive patterns below are written in lowercase and searched
+    # against the casefolded body, so a body is folded once rather than
+    # once per re.IGNORECASE pattern.
 
     # Severity patterns - using re.escape for literal characters
     # Pattern: _Potential issue_ | _Critical/Major/Minor_
     CRITICAL_PATTERN = re.compile(
-        r"_\u26a0\ufe0f\s*Potential issue_\s*\|\s*_\U0001f534\s*Critical_",
-        re.IGNORECASE,
-    )
-    MAJOR_PATTERN = re.compile(
-        r"_\u26a0\ufe0f\s*Potential issue_\s*\|\s*_\U0001f7e0\s*Major_",
-        re.IGNORECASE,
-    )
-    MINOR_PATTERN = re.compile(
-        r"_\u26a0\ufe0f\s*Potential issue_\s*\|\s*_\U0001f7e1\s*Minor_",
-        re.IGNORECASE,
+        r"_\u26a0\ufe0f\s*potential issue_\s*\|\s*_\U0001f534\s*critical_"
     )
+    MAJOR_PATTERN = re.compile(r"_\u26a0\ufe0f\s*potential issue_\s*\|\s*_\U0001f7e0\s*major_")
+    MINOR_PATTERN = re.compile(r"_\u26a0\ufe0f\s*potential issue_\s*\|\s*_\U0001f7e1\s*minor_")
 
     # Non-actionable patterns
-    TRIVIAL_PATTERN = re.compile(r"_\U0001f535\s*Trivial_", re.IGNORECASE)
-    NITPICK_PATTERN = re.compile(r"_\U0001f9f9\s*Nitpick_", re.IGNORECASE)
+    TRIVIAL_PATTERN = re.compile(r"_\U0001f535\s*trivial_")
+    NITPICK_PATTERN = re.compile(r"_\U0001f9f9\s*nitpick_")
 
     # Fingerprinting comments (internal CodeRabbit metadata)
-    FINGERPRINT_PATTERN = re.compile(r"<!--\s*fingerprinting:", re.IGNORECASE)
+    FINGERPRINT_PATTERN = re.compile(r"<!--\s*fingerprinting:")
 
     # Addressed status marker
-    ADDRESSED_PATTERN = re.compile(r"\u2705\s*Addressed", re.IGNORECASE)
+    ADDRESSED_PATTERN = re.compile(r"\u2705\s*addressed")
 
     # Acknowledgment patterns (thank-you replies indicating issue was addressed)
     # These are reply comments from CodeRabbit confirming a fix was applied
     # Note: GitHub usernames can contain hyphens, so we use [\w-] instead of \w
-    ACKNOWLEDGMENT_PATTERNS = [
+    ACKNOWLEDGMENT_PATTERNS: tuple[re.Pattern[str], ...] = (
         # "@username Thank you for the fix/catch/suggestion/addressing"
-        re.compile(
-            r"`?@[\w-]+`?\s+Thank\s+you\s+for\s+(the\s+)?(fix|catch|suggestion|addressing)",
-            re.IGNORECASE,
-        ),
+        re.compile(r"`?@[\w-]+`?\s+thank\s+you\s+for\s+(the\s+)?(fix|catch|suggestion|addressing)"),
         # "Thank you for addressing this"
-        re.compile(r"Thank\s+you\s+for\s+addressing\s+this", re.IGNORECASE),
+        re.compile(r"thank\s+you\s+for\s+addressing\s+this"),
         # Starts with "Thank you" and contains keywords like fix, addressed, suggestion
         re.compile(
-            r"^`?@?[\w-]*`?\s*,?\s*[Tt]hank\s+you.*?(fix|addressed|updated|resolved|correct|suggestion)",
-            re.IGNORECASE,
+            r"^`?@?[\w-]*`?\s*,?\s*thank\s+you.*?(fix|addressed|updated|resolved|correct|suggestion)"
         ),
-    ]
+    )
 
     # Outside diff range (in review body)
-    OUTSIDE_DIFF_PATTERN = re.compile(r"Outside diff range", re.IGNORECASE)
+    OUTSIDE_DIFF_PATTERN = re.compile(r"outside diff range")
+
+    # All single-pattern markers combined into one alternation, so a body is
+    # scanned once and the set of matched group names drives classification.
+    # None of the markers can overlap, so finditer sees every one present.
+    MARKER_PATTERN = re.compile(
+        "|".join(
+            f"(?P<{name}>{pattern.pattern})"
+            for name, pattern in (
+                ("fingerprint", FINGERPRINT_PATTERN),
+                ("addressed", ADDRESSED_PATTERN),
+                ("critical", CRITICAL_PATTERN),
+                ("major", MAJOR_PATTERN),
+                ("minor", MINOR_PATTERN),
+                ("trivial", TRIVIAL_PATTERN),
+                ("nitpick", NITPICK_PATTERN),
+                ("outside_diff", OUTSIDE_DIFF_PATTERN),
+            )
+        )
+    )
+
+    # Shared results for the outcomes that don't depend on a severity marker
+    NON_ACTIONABLE_RESULT = (CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False)
+    AMBIGUOUS_RESULT = (CommentClassification.AMBIGUOUS, Priority.UNKNOWN, True)
+
+    # Classification for each marker group, in order of precedence.
+    # Fingerprinting comments (internal metadata) and addressed markers
+    # override any severity in the same body.
+    MARKER_RESULTS: tuple[tuple[str, tuple[CommentClassification, Priority, bool]], ...] = (
+        ("fingerprint", NON_ACTIONABLE_RESULT),
+        ("addressed", NON_ACTIONABLE_RESULT),
+        ("critical", (CommentClassification.ACTIONABLE, Priority.CRITICAL, False)),
+        ("major", (CommentClassification.ACTIONABLE, Priority.MAJOR, False)),
+        ("minor", (CommentClassification.ACTIONABLE, Priority.MINOR, False)),
+        ("trivial", (CommentClassification.NON_ACTIONABLE, Priority.TRIVIAL, False)),
+        ("nitpick", (CommentClassification.NON_ACTIONABLE, Priority.TRIVIAL, False)),
+        ("outside_diff", (CommentClassification.ACTIONABLE, Priority.MINOR, False)),
+    )
 
     # Summary/walkthrough patterns (non-actionable informational content)
     # These are overview sections that don't require action
-    SUMMARY_PATTERNS = [
+    SUMMARY_PATTERNS: tuple[re.Pattern[str], ...] = (
         # Walkthrough header
         re.compile(r"^##\s*Walkthrough", re.MULTILINE),
         # Changes summary header
@@ -120,29 +156,36 @@ class CodeRabbitParser(ReviewerParser):
         re.compile(r"```mermaid", re.IGNORECASE),
         # PR Objectives section
         re.compile(r"^##\s*Objectives", re.MULTILINE | re.IGNORECASE),
-    ]
+    )
+
+    # Literals that every SUMMARY_PATTERNS match contains: "##" for the
+    # headers, "|" for the file table and "```" for mermaid diagrams.
+    # Bodies without any of them are rejected without running a regex.
+    SUMMARY_SENTINELS = ("##", "|", "```")
 
     # Tip/info box patterns (non-actionable)
-    TIP_PATTERNS = [
+    TIP_PATTERNS: tuple[re.Pattern[str], ...] = (
         re.compile(r"^>\s*\[!TIP\]", re.MULTILINE),
         re.compile(r"^>\s*\[!NOTE\]", re.MULTILINE),
         re.compile(r"^>\s*\[!INFO\]", re.MULTILINE),
-    ]
+    )
+
+    # Literal every TIP_PATTERNS match contains
+    TIP_SENTINEL = "[!"
 
     # PR-level summary comment patterns (non-actionable)
     # These are posted at the PR level (path=None, line=None) and contain
     # overview information. The actual actionable items are in inline comments.
-    PR_SUMMARY_PATTERNS = [
-        # "Actionable comments posted: N" pattern
-        re.compile(r"Actionable comments posted:\s*\d+", re.IGNORECASE),
+    # Each entry is a sequence of casefolded literals that must all occur,
+    # in order, anywhere in the body.
+    PR_SUMMARY_MARKERS: tuple[tuple[str, ...], ...] = (
+        # "Actionable comments posted: N" header
+        ("actionable comments posted:",),
         # <details> sections with summaries
-        re.compile(r"<details>.*?<summary>.*?</summary>", re.IGNORECASE | re.DOTALL),
+        ("<details>", "<summary>", "</summary>"),
         # CodeRabbit auto-generated comment signature
-        re.compile(
-            r"<!-- This is an auto-generated comment.*?by coderabbit",
-            re.IGNORECASE | re.DOTALL,
-        ),
-    ]
+        (CODERABBIT_SIGNATURE_START, "by coderabbit"),
+    )
 
     @property
     def reviewer_type(self) -> ReviewerType:
@@ -171,11 +214,14 @@ class CodeRabbitParser(ReviewerParser):
         if author == self.CODERABBIT_AUTHOR:
             return True
 
-        # Fallback detection: check body for signature
-        if body and self.CODERABBIT_SIGNATURE_PATTERN.search(body):
-            return True
-
-        return False
+        # Fallback detection: check body for signature. The signature lives in
+        # an HTML comment, so a literal "<!--" probe rejects most bodies before
+        # the body is casefolded.
+        if not body or "<!--" not in body:
+            return False
+        return self._contains_in_order(
+            body.casefold(), (self.CODERABBIT_SIGNATURE_START, self.CODERABBIT_SIGNATURE_END)
+        )
 
     def _parse_impl(self, comment: dict) -> tuple[CommentClassification, Priority, bool]:
         """Parser-specific classification logic for CodeRabbit comments.
@@ -209,62 +255,21 @@ class CodeRabbitParser(ReviewerParser):
             - priority: Priority enum value
             - requires_investigation: Boolean, True for AMBIGUOUS comments
         """
-        # Check for PR-level summary comments first (highest precedence)
-        # These are posted at the PR level and contain overview information
-        if self._is_pr_summary_comment(comment):
-            return (CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False)
-
-        body = comment.get("body", "")
+        body = comment.get("body") or ""
 
-        # Early exit for empty body
+        # Early exit for empty or missing body, before any pattern work
         if not body:
-            return (CommentClassification.AMBIGUOUS, Priority.UNKNOWN, True)
-
-        # Check fingerprinting comments first (internal metadata, ignore)
-        if self.FINGERPRINT_PATTERN.search(body):
-            return (CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False)
-
-        # Check addressed marker
-        if self.ADDRESSED_PATTERN.search(body):
-            return (CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False)
-
-        # Check acknowledgment patterns (thank-you replies)
-        if self._is_acknowledgment(body):
-            return (CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False)
-
-        # Check severity patterns (most specific first)
-        if self.CRITICAL_PATTERN.search(body):
-            return (CommentClassification.ACTIONABLE, Priority.CRITICAL, False)
-
-        if self.MAJOR_PATTERN.search(body):
-            return (CommentClassification.ACTIONABLE, Priority.MAJOR, False)
-
-        if self.MINOR_PATTERN.search(body):
-            return (CommentClassification.ACTIONABLE, Priority.MINOR, False)
-
-        # Check non-actionable patterns
-        if self.TRIVIAL_PATTERN.search(body):
-            return (CommentClassification.NON_ACTIONABLE, Priority.TRIVIAL, False)
-
-        if self.NITPICK_PATTERN.search(body):
-            return (CommentClassification.NON_ACTIONABLE, Priority.TRIVIAL, False)
+            return self.AMBIGUOUS_RESULT
 
-        # Check outside diff range (actionable but lower priority)
-        if self.OUTSIDE_DIFF_PATTERN.search(body):
-            return (CommentClassification.ACTIONABLE, Priority.MINOR, False)
-
-        # Check for summary/walkthrough sections (non-actionable informational)
-        if self._is_summary_content(body):
-            return (CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False)
-
-        # Check for tip/info boxes (non-actionable)
-        if self._is_tip_content(body):
-            return (CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False)
+        # Check for PR-level summary comments first (highest precedence)
+        # These are posted at the PR level and contain overview information
+        if self._is_pr_summary_comment(comment):
+            return self.NON_ACTIONABLE_RESULT
 
-        # Default: AMBIGUOUS - requires investigation
-        return (CommentClassification.AMBIGUOUS, Priority.UNKNOWN, True)
+        return _classify_body(body)
 
-    def _is_summary_content(self, body: str) -> bool:
+    @classmethod
+    def _is_summary_content(cls, body: str) -> bool:
         """Check if the body is a summary/walkthrough section.
 
         Summary sections are informational overviews that don't require
@@ -277,12 +282,15 @@ class CodeRabbitParser(ReviewerParser):
         Returns:
             True if the body appears to be a summary section.
         """
-        for pattern in self.SUMMARY_PATTERNS:
+        if not any(sentinel in body for sentinel in cls.SUMMARY_SENTINELS):
+            return False
+        for pattern in cls.SUMMARY_PATTERNS:
             if pattern.search(body):
                 return True
         return False
 
-    def _is_tip_content(self, body: str) -> bool:
+    @classmethod
+    def _is_tip_content(cls, body: str) -> bool:
         """Check if the body is a tip/info box.
 
         Tip boxes are informational callouts that provide helpful
@@ -294,29 +302,34 @@ class CodeRabbitParser(ReviewerParser):
         Returns:
             True if the body appears to be a tip/info box.
         """
-        for pattern in self.TIP_PATTERNS:
+        if cls.TIP_SENTINEL not in body:
+            return False
+        for pattern in cls.TIP_PATTERNS:
             if pattern.search(body):
                 return True
         return False
 
-    def _is_acknowledgment(self, body: str) -> bool:
+    @classmethod
+    def _is_acknowledgment(cls, body: str) -> bool:
         """Check if the body is an acknowledgment/thank-you reply.
 
         Acknowledgment comments are replies from CodeRabbit confirming
         that a fix or suggestion was addressed. These don't require action.
 
         Args:
-            body: Comment body text.
+            body: Comment body text. It is casefolded here, since the
+                acknowledgment patterns are written in lowercase.
 
         Returns:
             True if the body appears to be an acknowledgment.
         """
-        for pattern in self.ACKNOWLEDGMENT_PATTERNS:
-            if pattern.search(body):
+        folded = body.casefold()
+        for pattern in cls.ACKNOWLEDGMENT_PATTERNS:
+            if pattern.search(folded):
                 return True
         return False
 
-    def _has_actionable_severity_markers(self, body: str) -> bool:
+    def _has_actionable_severity_markers(self, folded_body: str) -> bool:
         """Check if body contains actionable severity markers.
 
         This is used to prevent filtering PR-level comments that contain
@@ -324,12 +337,16 @@ class CodeRabbitParser(ReviewerParser):
         contain summary patterns.
 
         Args:
-            body: Comment body text.
+            folded_body: Comment body text, already casefolded by the caller.
+                The severity patterns are lowercase, so raw text with
+                capitalized labels would not match.
 
         Returns:
             True if the body contains Critical or Major severity markers.
         """
-        return bool(self.CRITICAL_PATTERN.search(body) or self.MAJOR_PATTERN.search(body))
+        if self.CRITICAL_EMOJI in folded_body and self.CRITICAL_PATTERN.search(folded_body):
+            return True
+        return bool(self.MAJOR_EMOJI in folded_body and self.MAJOR_PATTERN.search(folded_body))
 
     def _is_pr_summary_comment(self, comment: dict) -> bool:
         """Check if this is a PR-level summary comment.
@@ -363,14 +380,16 @@ class CodeRabbitParser(ReviewerParser):
         if not body:
             return False
 
+        folded = body.casefold()
+
         # Safety check: if the comment contains actionable severity markers,
         # do NOT filter it as a summary - let it be classified by severity
-        if self._has_actionable_severity_markers(body):
+        if self._has_actionable_severity_markers(folded):
             return False
 
-        # Check for PR summary patterns
-        for pattern in self.PR_SUMMARY_PATTERNS:
-            if pattern.search(body):
+        # Check for PR summary markers
+        for needles in self.PR_SUMMARY_MARKERS:
+            if self._contains_in_order(folded, needles):
                 return True
 
         # Also check for summary/walkthrough content at PR level
@@ -379,21 +398,49 @@ class CodeRabbitParser(ReviewerParser):
 
         return False
 
-    # Pattern to match the "Outside diff range comments" details section
-    # Matches: <details>\n<summary>... Outside diff range comments (N)</summary>
-    OUTSIDE_DIFF_SECTION_PATTERN = re.compile(
-        r"<details>\s*\n\s*<summary>.*?"
-        r"Outside diff range comments?\s*\(\d+\)\s*"
-        r"</summary>(.*?)</details>",
-        re.IGNORECASE | re.DOTALL,
-    )
+    @staticmethod
+    def _contains_in_order(text: str, needles: tuple[str, ...]) -> bool:
+        """Check that each needle occurs in text after the end of the previous one.
+
+        Args:
+            text: Text to search.
+            needles: Literal substrings, in the order they must appear.
+
+        Returns:
+            True if every needle is found in order.
+        """
+        position = 0
+        for needle in needles:
+            position = text.find(needle, position)
+            if position == -1:
+                return False
+            position += len(needle)
+        return True
+
+    # Summary text that opens the "Outside diff range comments" section,
+    # matched against the casefolded contents of a single <summary> tag
+    # Matches: ... outside diff range comments (N)
+    OUTSIDE_DIFF_SUMMARY_PATTERN = re.compile(r"outside diff range comments?\s*\(\d+\)\s*$")
+
+    # Section tags, matched case-insensitively like any HTML tag. Each is a
+    # short literal, so searching for one never backtracks over the body.
+    # A casefolded copy of the body can't be used to find offsets, because
+    # casefolding may change its length (e.g. "\u00df" -> "ss").
+    SUMMARY_OPEN_TAG = re.compile(r"<summary>", re.IGNORECASE)
+    SUMMARY_CLOSE_TAG = re.compile(r"</summary>", re.IGNORECASE)
+    DETAILS_CLOSE_TAG = re.compile(r"</details>", re.IGNORECASE)
+    # Searched up to a <summary> tag, which it must directly follow
+    DETAILS_OPEN_TAG = re.compile(r"<details>\s*\Z", re.IGNORECASE)
 
     # Pattern to extract individual file path and line references
     # Matches: **src/config.py:42-45**: or **src/utils.py:100**:
-    # Uses [ \t]* instead of \s* to avoid consuming newlines (needed for lookahead)
+    # The body consumes any character except a newline that starts the next
+    # "\n\n**path:N" item, so finditer walks the section in one linear pass
+    # without the lazy-quantifier/lookahead retries at every position.
+    # Uses [ \t]* instead of \s* so leading blank lines are not swallowed.
     OUTSIDE_DIFF_ITEM_PATTERN = re.compile(
-        r"\*\*([^:*]+):(\d+(?:-\d+)?)\*\*:[ \t]*(.*?)(?=(?:\n\n\*\*[^:*]+:\d)|$)",
-        re.DOTALL,
+        r"\*\*(?P<path>[^:*]+):(?P<lines>\d+(?:-\d+)?)\*\*:[ \t]*"
+        r"(?P<body>(?:[^\n]|\n(?!\n\*\*[^:*]+:\d))*)"
     )
 
     def parse_outside_diff_comments(
@@ -433,34 +480,104 @@ class CodeRabbitParser(ReviewerParser):
         if not review_body:
             return []
 
-        results: list[OutsideDiffComment] = []
-
         # Find the outside diff section
-        section_match = self.OUTSIDE_DIFF_SECTION_PATTERN.search(review_body)
-        if not section_match:
+        section_content = self._find_outside_diff_section(review_body)
+        if section_content is None:
             return []
 
-        section_content = section_match.group(1)
-
-        # Extract individual items from the section
-        for item_match in self.OUTSIDE_DIFF_ITEM_PATTERN.finditer(section_content):
-            file_path = item_match.group(1).strip()
-            line_range = item_match.group(2).strip()
-            body = item_match.group(3).strip()
-
-            # Clean up the body - remove trailing whitespace and empty lines
-            body = body.strip()
-
-            if file_path and body:
-                results.append(
-                    OutsideDiffComment(
-                        source=author,
-                        review_id=review_id,
-                        file_path=file_path,
-                        line_range=line_range if line_range else None,
-                        body=body,
-                        review_url=review_url,
-                    )
-                )
-
-        return results
+        # Extract individual items from the section in a single scan
+        return [
+            OutsideDiffComment(
+                source=author,
+                review_id=review_id,
+                file_path=file_path,
+                line_range=line_range if line_range else None,
+                body=body,
+                review_url=review_url,
+            )
+            for file_path, line_range, body in (
+                (item_match["path"].strip(), item_match["lines"], item_match["body"].strip())
+                for item_match in self.OUTSIDE_DIFF_ITEM_PATTERN.finditer(section_content)
+            )
+            if file_path and body
+        ]
+
+    def _find_outside_diff_section(self, review_body: str) -> str | None:
+        """Locate the content of the "Outside diff range comments" section.
+
+        Walks the <summary> tags with literal tag searches and casefolds only
+        the short summary text, so the (possibly large) review body is never
+        scanned by the summary regex.
+
+        Args:
+            review_body: The full body text of a review.
+
+        Returns:
+            The text between the section's </summary> and </details> tags,
+            or None if the body has no complete outside diff section.
+        """
+        position = 0
+        while True:
+            summary_open = self.SUMMARY_OPEN_TAG.search(review_body, position)
+            if not summary_open:
+                return None
+            summary_close = self.SUMMARY_CLOSE_TAG.search(review_body, summary_open.end())
+            if not summary_close:
+                return None
+
+            # The summary must open a <details> block
+            summary = review_body[summary_open.end() : summary_close.start()]
+            if self.DETAILS_OPEN_TAG.search(
+                review_body, position, summary_open.start()
+            ) and self.OUTSIDE_DIFF_SUMMARY_PATTERN.search(summary.casefold()):
+                details_close = self.DETAILS_CLOSE_TAG.search(review_body, summary_close.end())
+                if not details_close:
+                    return None
+                return review_body[summary_close.end() : details_close.start()]
+            position = summary_close.end()
+
+
+# Keyed on the body alone, so the cache never holds a parser instance.
+# Bounded because every entry keeps a full comment body alive.
+@functools.lru_cache(maxsize=4096)
+def _classify_body(body: str) -> tuple[CommentClassification, Priority, bool]:
+    """Classify a non-empty CodeRabbit comment body, memoized per body.
+
+    CodeRabbit repeats the same canned blurbs (nitpicks, fingerprints,
+    acknowledgments) across reviews, so identical bodies skip all regex
+    work after the first hit. Only the body-dependent rules live here;
+    the path-dependent PR-level summary check stays in
+    CodeRabbitParser._parse_impl.
+
+    Args:
+        body: Comment body text; must be non-empty.
+
+    Returns:
+        Tuple of (classification, priority, requires_investigation).
+    """
+    parser = CodeRabbitParser
+
+    # Check acknowledgment patterns (thank-you replies); like fingerprint
+    # and addressed markers, they override any severity they quote
+    if parser._is_acknowledgment(body):
+        return parser.NON_ACTIONABLE_RESULT
+
+    folded = body.casefold()
+
+    # Fingerprint/addressed, severity, trivial/nitpick and outside diff
+    # range markers, in order of precedence
+    markers = {match.lastgroup for match in parser.MARKER_PATTERN.finditer(folded)}
+    for marker, result in parser.MARKER_RESULTS:
+        if marker in markers:
+            return result
+
+    # Check for summary/walkthrough sections (non-actionable informational)
+    if parser._is_summary_content(body):
+        return parser.NON_ACTIONABLE_RESULT
+
+    # Check for tip/info boxes (non-actionable)
+    if parser._is_tip_content(body):
+        return parser.NON_ACTIONABLE_RESULT
+
+    # Default: AMBIGUOUS - requires investigation
+    return parser.AMBIGUOUS_RESULT
@@ -41,39 +41,44 @@ class CursorBugbotParser(ReviewerParser):
         - No severity indicator -> AMBIGUOUS, UNKNOWN
     """
 
+    __slots__ = ()
+
     # Author patterns that identify Cursor/Bugbot comments
-    _AUTHOR_PATTERNS = frozenset({"cursor[bot]", "cursor-bot"})
+    _AUTHOR_PATTERNS: frozenset[str] = frozenset({"cursor[bot]", "cursor-bot"})
+
+    # Casefolded literals in body that indicate Cursor/Bugbot origin
+    _CURSOR_BODY_SIGNATURES: tuple[str, ...] = ("cursor.com",)
+
+    # Severity markers combined into one alternation, so a body is scanned
+    # once; the matched group names are resolved by _SEVERITY_RESULTS.
+    # Written in lowercase and searched against the casefolded body; re.ASCII
+    # limits \s to ASCII whitespace (including line breaks).
+    _SEVERITY_PATTERN = re.compile(
+        r"(?P<critical>critical\s+severity)"
+        r"|(?P<high>high\s+severity)"
+        r"|(?P<medium>medium\s+severity)"
+        r"|(?P<low>low\s+severity)",
+        re.ASCII,
+    )
 
-    # Patterns in body that indicate Cursor/Bugbot origin
-    _CURSOR_BODY_SIGNATURES = (re.compile(r"cursor\.com", re.IGNORECASE),)
+    # Casefolded literal every _SEVERITY_PATTERN match contains
+    _SEVERITY_SENTINEL = "severity"
 
-    # Severity patterns and their classifications
-    _SEVERITY_PATTERNS = (
-        (
-            re.compile(r"Critical\s+Severity", re.IGNORECASE),
-            CommentClassification.ACTIONABLE,
-            Priority.CRITICAL,
-        ),
-        (
-            re.compile(r"High\s+Severity", re.IGNORECASE),
-            CommentClassification.ACTIONABLE,
-            Priority.MAJOR,
-        ),
-        (
-            re.compile(r"Medium\s+Severity", re.IGNORECASE),
-            CommentClassification.ACTIONABLE,
-            Priority.MINOR,
-        ),
-        (
-            re.compile(r"Low\s+Severity", re.IGNORECASE),
-            CommentClassification.NON_ACTIONABLE,
-            Priority.TRIVIAL,
-        ),
+    # Shared results for comments without a severity marker
+    _NON_ACTIONABLE_RESULT = (CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False)
+    _AMBIGUOUS_RESULT = (CommentClassification.AMBIGUOUS, Priority.UNKNOWN, True)
+
+    # Classification for each severity group, in order of priority
+    _SEVERITY_RESULTS: tuple[tuple[str, tuple[CommentClassification, Priority, bool]], ...] = (
+        ("critical", (CommentClassification.ACTIONABLE, Priority.CRITICAL, False)),
+        ("high", (CommentClassification.ACTIONABLE, Priority.MAJOR, False)),
+        ("medium", (CommentClassification.ACTIONABLE, Priority.MINOR, False)),
+        ("low", (CommentClassification.NON_ACTIONABLE, Priority.TRIVIAL, False)),
     )
 
     # PR-level summary patterns (non-actionable)
     # These indicate a review summary, not an actual issue
-    _SUMMARY_PATTERNS = (
+    _SUMMARY_PATTERNS: tuple[re.Pattern[str], ...] = (
         # "Cursor Bugbot has reviewed your changes and found N potential issue(s)"
         re.compile(
             r"Cursor Bugbot has reviewed your changes and found \d+ potential issues?",
@@ -109,12 +114,9 @@ class CursorBugbotParser(ReviewerParser):
         if author_lower in self._AUTHOR_PATTERNS:
             return True
 
-        # Check body signatures
-        for pattern in self._CURSOR_BODY_SIGNATURES:
-            if pattern.search(body):
-                return True
-
-        return False
+        # Check body signatures (case-insensitive substring match)
+        body_folded = body.casefold()
+        return any(signature in body_folded for signature in self._CURSOR_BODY_SIGNATURES)
 
     def _parse_impl(self, comment: dict) -> tuple[CommentClassification, Priority, bool]:
         """Parser-specific classification logic for Cursor/Bugbot comments.
@@ -135,19 +137,36 @@ class CursorBugbotParser(ReviewerParser):
             - priority: Priority enum value
             - requires_investigation: True if AMBIGUOUS, False otherwise
         """
-        body = comment.get("body", "")
-
-        # Check each severity pattern in order of priority
-        for pattern, classification, priority in self._SEVERITY_PATTERNS:
-            if pattern.search(body):
-                return classification, priority, False
+        body = comment.get("body") or ""
+
+        # Bodies shorter than "severity" cannot carry any marker (the summary
+        # pattern is longer still), so skip all pattern work
+        if len(body) < len(self._SEVERITY_SENTINEL):
+            return self._AMBIGUOUS_RESULT
+
+        # Collect the severities present in a single scan; nothing outranks
+        # Critical, so stop as soon as it is seen. Every severity marker
+        # contains the literal "severity", so bodies without it skip the
+        # regex entirely.
+        severities: set[str | None] = set()
+        folded = body.casefold()
+        if self._SEVERITY_SENTINEL in folded:
+            for match in self._SEVERITY_PATTERN.finditer(folded):
+                severities.add(match.lastgroup)
+                if match.lastgroup == "critical":
+                    break
+
+        # Highest-priority severity wins, wherever it appears in the body
+        for severity, result in self._SEVERITY_RESULTS:
+            if severity in severities:
+                return result
 
         # Check for PR-level summary comments (non-actionable)
         # These are informational summaries, not actual issues
         for pattern in self._SUMMARY_PATTERNS:
             if pattern.search(body):
-                return CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False
+                return self._NON_ACTIONABLE_RESULT
 
         # No recognized severity pattern - classify as ambiguous
         # This requires investigation by the agent
-        return CommentClassification.AMBIGUOUS, Priority.UNKNOWN, True
+        return self._AMBIGUOUS_RESULT
@@ -46,6 +46,12 @@ class GenericParser(ReviewerParser):
     important feedback by automatically dismissing it.
     """
 
+    __slots__ = ()
+
+    # Shared results; the generic parser never assesses priority
+    NON_ACTIONABLE_RESULT = (CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False)
+    AMBIGUOUS_RESULT = (CommentClassification.AMBIGUOUS, Priority.UNKNOWN, True)
+
     # Patterns indicating a reply that confirms something was addressed
     # These are typically non-actionable acknowledgments
     REPLY_CONFIRMATION_PATTERNS = [
@@ -129,19 +135,19 @@ class GenericParser(ReviewerParser):
             - priority: Priority.UNKNOWN (generic parser doesn't assess priority)
             - requires_investigation: True for AMBIGUOUS, False otherwise
         """
-        body = comment.get("body", "")
+        body = comment.get("body") or ""
 
         # Check for reply confirmation patterns (acknowledging fixes)
         if self._is_reply_confirmation(body):
-            return (CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False)
+            return self.NON_ACTIONABLE_RESULT
 
         # Check for approval patterns (LGTM, looks good, etc.)
         if self._is_approval(body):
-            return (CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False)
+            return self.NON_ACTIONABLE_RESULT
 
         # All other cases: AMBIGUOUS with requires_investigation=True
         # Critical: AMBIGUOUS comments MUST always have requires_investigation=True
-        return (CommentClassification.AMBIGUOUS, Priority.UNKNOWN, True)
+        return self.AMBIGUOUS_RESULT
 
     def _is_reply_confirmation(self, body: str) -> bool:
         """Check if the body is a reply confirmation.
@@ -5,7 +5,7 @@ interface for parsing and classifying comments from the Vercel deployment bot.
 
 Vercel comments are identified by:
 - Author: "vercel[bot]"
-- Body patterns: Contains "[vc]:", "vercel.com", or deployment table with "Preview" links
+- Body patterns: Contains "[vc]:", "vercel.com", or a .vercel.app deployment URL
 
 Classification rules:
 - ALL Vercel comments are NON_ACTIONABLE / TRIVIAL - they are deployment status
@@ -32,11 +32,22 @@ class VercelParser(ReviewerParser):
     notifications and are always classified as NON_ACTIONABLE.
     """
 
-    # Pattern to detect Vercel signature/branding in body
-    VERCEL_SIGNATURE_PATTERN = re.compile(
-        r"\[vc\]:|vercel\.com|" r"https?://[^\s]*\.vercel\.app|" r"\*\*Preview\*\*",
-        re.IGNORECASE,
-    )
+    __slots__ = ()
+
+    # Login of the Vercel deployment bot (compared lowercased)
+    VERCEL_AUTHOR = "vercel[bot]"
+
+    # Shared result; every open Vercel comment classifies the same way
+    NON_ACTIONABLE_RESULT = (CommentClassification.NON_ACTIONABLE, Priority.TRIVIAL, False)
+
+    # Literal Vercel signatures/branding, matched against the casefolded body
+    VERCEL_BODY_SIGNATURES: tuple[str, ...] = ("[vc]:", "vercel.com")
+
+    # Deployment URL: a scheme followed by a host ending in .vercel.app.
+    # The lookahead ends the host there, so "foo.vercel.app.evil.com" and
+    # "my.vercel.application.io" don't match. A bare host mention in a
+    # human comment is not a Vercel signature either.
+    VERCEL_APP_URL_PATTERN = re.compile(r"https?://[^\s/]*\.vercel\.app(?=[/:?#\s)\]]|\Z)")
 
     @property
     def reviewer_type(self) -> ReviewerType:
@@ -61,15 +72,19 @@ class VercelParser(ReviewerParser):
         Returns:
             True if this appears to be a Vercel comment, False otherwise.
         """
-        # Primary detection: author is vercel bot
-        if author.lower() == "vercel[bot]":
+        # Primary detection: author is vercel bot. Lowercasing only on a
+        # length match skips the copy for almost every other author.
+        if len(author) == len(self.VERCEL_AUTHOR) and author.lower() == self.VERCEL_AUTHOR:
             return True
 
         # Fallback detection: body contains Vercel signature
-        if self.VERCEL_SIGNATURE_PATTERN.search(body):
+        if not body:
+            return False
+        folded = body.casefold()
+        if any(sig in folded for sig in self.VERCEL_BODY_SIGNATURES):
             return True
-
-        return False
+        # Literal probe first, so most bodies never reach the URL regex
+        return ".vercel.app" in folded and bool(self.VERCEL_APP_URL_PATTERN.search(folded))
 
     def _parse_impl(self, comment: dict) -> tuple[CommentClassification, Priority, bool]:
         """Parser-specific classification logic for Vercel comments.
@@ -87,4 +102,4 @@ class VercelParser(ReviewerParser):
         Returns:
             Tuple of (NON_ACTIONABLE, TRIVIAL, False) - always.
         """
-        return CommentClassification.NON_ACTIONABLE, Priority.TRIVIAL, False
+        return self.NON_ACTIONABLE_RESULT
@@ -7,6 +7,7 @@ including mock data factories, container setup, and GitHub response fixtures.
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -87,6 +88,32 @@ class MockableGitHubAdapter(GitHubPort):
         """Set the commit data to return from get_commit."""
         self._commit_data = data
 
+    def configure(
+        self,
+        *,
+        pr: dict[str, Any] | None = None,
+        comments: Iterable[dict[str, Any]] = (),
+        reviews: Iterable[dict[str, Any]] = (),
+        threads: Iterable[dict[str, Any]] = (),
+        ci: dict[str, Any] | None = None,
+        commit: dict[str, Any] | None = None,
+    ) -> MockableGitHubAdapter:
+        """Set every response in a single call.
+
+        Responses that are not passed are reset to their empty defaults,
+        so each call fully describes the PR the adapter represents.
+
+        Returns:
+            The adapter itself, for use in fixtures.
+        """
+        self._pr_data = pr if pr is not None else {}
+        self._comments = list(comments)
+        self._reviews = list(reviews)
+        self._threads = list(threads)
+        self._ci_status = ci if ci is not None else {}
+        self._commit_data = commit if commit is not None else {}
+        return self
+
     def get_pr(self, owner: str, repo: str, pr_number: int) -> dict[str, Any]:
         """Return configured PR data."""
         return self._pr_data
@@ -138,9 +165,13 @@ def test_container(mock_github: MockableGitHubAdapter) -> Container:
 # ============================================================================
 # Common Mock Data Factories
 # ============================================================================
+#
+# The factories are stateless and return a fresh dict on every call, so a
+# single instance is shared across the whole session. Callers may mutate the
+# returned data freely.
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_pr_data():
     """Factory for creating PR data dictionaries.
 
@@ -174,7 +205,7 @@ def make_pr_data():
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_comment():
     """Factory for creating comment data dictionaries.
 
@@ -208,7 +239,7 @@ def make_comment():
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_review():
     """Factory for creating review data dictionaries.
 
@@ -234,7 +265,7 @@ def make_review():
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_thread():
     """Factory for creating thread data dictionaries.
 
@@ -262,7 +293,7 @@ def make_thread():
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_ci_status():
     """Factory for creating CI status data dictionaries.
 
@@ -284,7 +315,7 @@ def make_ci_status():
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_check_run():
     """Factory for creating check run data dictionaries.
 
@@ -308,7 +339,7 @@ def make_check_run():
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_commit_data():
     """Factory for creating commit data dictionaries.
 
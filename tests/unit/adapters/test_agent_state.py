@@ -16,9 +16,13 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from goodtogo.adapters.agent_state import ActionType, AgentAction, AgentState
 from goodtogo.adapters.time_provider import MockTimeProvider
 
+pytestmark = pytest.mark.slow
+
 
 class TestAgentStateInit:
     """Tests for AgentState initialization."""
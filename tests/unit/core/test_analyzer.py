@@ -38,6 +38,7 @@ class TestAnalyzerDismissalIntegration:
             yield state
             state.close()
 
+    @pytest.mark.slow
     def test_classify_comment_returns_non_actionable_for_dismissed(
         self, test_container, agent_state, make_comment
     ):
@@ -70,6 +71,7 @@ Missing null check in handler function.
         assert result.classification == CommentClassification.NON_ACTIONABLE
         assert result.requires_investigation is False
 
+    @pytest.mark.slow
     def test_classify_comment_runs_parser_for_non_dismissed(
         self, test_container, agent_state, make_comment
     ):
@@ -95,6 +97,7 @@ Missing null check in handler function.
         # Should be processed normally and classified as ACTIONABLE
         assert result.classification == CommentClassification.ACTIONABLE
 
+    @pytest.mark.slow
     def test_dismiss_comment_method_persists_dismissal(
         self, test_container, agent_state, make_comment
     ):
@@ -134,6 +137,7 @@ Missing null check in handler function.
         # Should be processed normally and classified as ACTIONABLE
         assert result.classification == CommentClassification.ACTIONABLE
 
+    @pytest.mark.slow
     def test_dismissed_comment_has_priority_unknown(
         self, test_container, agent_state, make_comment
     ):
@@ -156,6 +160,7 @@ Missing null check in handler function.
         # Dismissed comments should have UNKNOWN priority (not evaluated)
         assert result.priority == Priority.UNKNOWN
 
+    @pytest.mark.slow
     def test_dismiss_comment_requires_pr_key(self, test_container, agent_state):
         """Test that dismiss_comment requires pr_key to be set."""
         # Create analyzer with agent state but no pr_key
@@ -175,6 +180,7 @@ Missing null check in handler function.
             analyzer.dismiss_comment("comment_1")
 
 
+@pytest.mark.slow
 class TestAnalyzerDismissalInFullAnalysis:
     """Tests for dismissal persistence in full PR analysis flow."""
 
@@ -19,7 +19,9 @@ from goodtogo.core.models import (
     PRAnalysisResult,
     Priority,
     PRStatus,
+    Review,
     ReviewerType,
+    ReviewState,
     ThreadSummary,
     UnresolvedThread,
 )
@@ -185,6 +187,20 @@ class TestReviewerTypeEnum:
         assert isinstance(ReviewerType.CODERABBIT, str)
 
 
+class TestReviewStateEnum:
+    """Tests for ReviewState enum values and behavior."""
+
+    def test_all_enum_values_exist(self):
+        """All GitHub review states are defined."""
+        expected_values = {"APPROVED", "CHANGES_REQUESTED", "COMMENTED", "DISMISSED", "PENDING"}
+        actual_values = {state.value for state in ReviewState}
+        assert actual_values == expected_values
+
+    def test_is_string_enum(self):
+        """ReviewState is a string enum for JSON serialization."""
+        assert isinstance(ReviewState.APPROVED, str)
+
+
 class TestCommentModel:
     """Tests for Comment Pydantic model."""
 
@@ -811,3 +827,107 @@ class TestOutsideDiffCommentModel:
         assert original.file_path == restored.file_path
         assert original.line_range == restored.line_range
         assert original.body == restored.body
+
+
+class TestReviewModel:
+    """Tests for the Review Pydantic model."""
+
+    @pytest.fixture
+    def valid_review_data(self):
+        """Provide valid review data for testing."""
+        return {
+            "id": "review_123",
+            "author": "reviewer-user",
+            "submitted_at": "2026-01-15T12:00:00Z",
+            "state": "APPROVED",
+            "body": "LGTM!",
+            "has_actionable_comments": False,
+            "url": "https://github.com/org/repo/pull/123#pullrequestreview-123",
+        }
+
+    def test_instantiation_with_valid_data(self, valid_review_data):
+        """Review model instantiates correctly with valid data."""
+        review = Review(**valid_review_data)
+        assert review.id == "review_123"
+        assert review.author == "reviewer-user"
+        assert review.submitted_at == "2026-01-15T12:00:00Z"
+        assert review.state == "APPROVED"
+        assert review.body == "LGTM!"
+        assert review.has_actionable_comments is False
+        assert review.url == "https://github.com/org/repo/pull/123#pullrequestreview-123"
+
+    def test_optional_fields_accept_none(self, valid_review_data):
+        """Optional fields accept None values."""
+        valid_review_data["body"] = None
+        valid_review_data["url"] = None
+
+        review = Review(**valid_review_data)
+        assert review.body is None
+        assert review.url is None
+
+    def test_has_actionable_comments_defaults_to_false(self):
+        """has_actionable_comments defaults to False when not provided."""
+        review = Review(
+            id="123",
+            author="user",
+            submitted_at="2026-01-15T12:00:00Z",
+            state="APPROVED",
+        )
+        assert review.has_actionable_comments is False
+
+    def test_all_review_states(self):
+        """Review accepts all valid GitHub review states."""
+        states = ["APPROVED", "CHANGES_REQUESTED", "COMMENTED", "DISMISSED", "PENDING"]
+        for state in states:
+            review = Review(
+                id="123",
+                author="user",
+                submitted_at="2026-01-15T12:00:00Z",
+                state=state,
+            )
+            assert review.state == state
+            assert review.state is ReviewState(state)
+
+    def test_unknown_review_state_rejected(self):
+        """Review rejects states outside the GitHub review state set."""
+        with pytest.raises(ValidationError):
+            Review(
+                id="123",
+                author="user",
+                submitted_at="2026-01-15T12:00:00Z",
+                state="MERGED",
+            )
+
+    def test_review_is_frozen(self, valid_review_data):
+        """Review fields cannot be reassigned after construction."""
+        review = Review(**valid_review_data)
+        with pytest.raises(ValidationError):
+            review.state = ReviewState.DISMISSED
+
+    def test_unknown_fields_rejected(self, valid_review_data):
+        """Review rejects fields that are not part of the model."""
+        valid_review_data["html_url"] = "https://github.com/org/repo/pull/123"
+        with pytest.raises(ValidationError):
+            Review(**valid_review_data)
+
+    @pytest.mark.serialization
+    def test_serialization_to_json(self, valid_review_data):
+        """Review model serializes to JSON correctly."""
+        review = Review(**valid_review_data)
+        json_str = review.model_dump_json()
+        data = json.loads(json_str)
+
+        assert data["id"] == "review_123"
+        assert data["author"] == "reviewer-user"
+        assert data["state"] == "APPROVED"
+
+    def test_serialization_roundtrip(self, valid_review_data):
+        """Review serializes and deserializes correctly."""
+        original = Review(**valid_review_data)
+        json_str = original.model_dump_json()
+        restored = Review.model_validate_json(json_str)
+
+        assert original.id == restored.id
+        assert original.author == restored.author
+        assert original.submitted_at == restored.submitted_at
+        assert original.state == restored.state
@@ -0,0 +1,38 @@
+"""Shared pytest fixtures for parser tests.
+
+Parsers hold no per-call state, so a single instance per parser type is
+created for the whole session and reused by every test that needs it.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from goodtogo.parsers.coderabbit import CodeRabbitParser
+from goodtogo.parsers.cursor import CursorBugbotParser
+from goodtogo.parsers.generic import GenericParser
+from goodtogo.parsers.vercel import VercelParser
+
+
+@pytest.fixture(scope="session")
+def coderabbit_parser() -> CodeRabbitParser:
+    """Return the session-wide CodeRabbitParser instance."""
+    return CodeRabbitParser()
+
+
+@pytest.fixture(scope="session")
+def cursor_parser() -> CursorBugbotParser:
+    """Return the session-wide CursorBugbotParser instance."""
+    return CursorBugbotParser()
+
+
+@pytest.fixture(scope="session")
+def generic_parser() -> GenericParser:
+    """Return the session-wide GenericParser instance."""
+    return GenericParser()
+
+
+@pytest.fixture(scope="session")
+def vercel_parser() -> VercelParser:
+    """Return the session-wide VercelParser instance."""
+    return VercelParser()
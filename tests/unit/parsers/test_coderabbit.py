@@ -9,424 +9,43 @@ This module tests the CodeRabbitParser implementation, verifying:
 - Correct priority and requires_investigation values
 """
 
+import gc
+import weakref
+from collections.abc import Callable
+from types import MappingProxyType
+from typing import Any, Optional
+
 import pytest
+from hypothesis import given
+from hypothesis import strategies as st
 
-from goodtogo.core.models import CommentClassification, OutsideDiffComment, Priority, ReviewerType
+from goodtogo.core.models import CommentClassification, Priority, ReviewerType
+from goodtogo.parsers import coderabbit
 from goodtogo.parsers.coderabbit import CodeRabbitParser
 
-
-class TestCodeRabbitParserCanParse:
-    """Tests for CodeRabbitParser.can_parse() method."""
-
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
-
-    def test_can_parse_by_author_exact_match(self, parser: CodeRabbitParser) -> None:
-        """Test detection by exact author match."""
-        assert parser.can_parse("coderabbitai[bot]", "") is True
-
-    def test_can_parse_by_author_case_sensitive(self, parser: CodeRabbitParser) -> None:
-        """Test that author matching is case-sensitive."""
-        # The parser uses exact match, so these should not match
-        assert parser.can_parse("CODERABBITAI[bot]", "") is False
-        assert parser.can_parse("CodeRabbitAI[bot]", "") is False
-
-    def test_can_parse_by_body_signature(self, parser: CodeRabbitParser) -> None:
-        """Test detection by body signature pattern."""
-        body = "<!-- This is an auto-generated comment by coderabbit.ai -->"
-        assert parser.can_parse("other-user", body) is True
-
-    def test_can_parse_by_body_signature_case_insensitive(self, parser: CodeRabbitParser) -> None:
-        """Test that body signature detection is case-insensitive."""
-        body = "<!-- This is an auto-generated comment by CodeRabbit.AI -->"
-        assert parser.can_parse("other-user", body) is True
-
-    def test_can_parse_non_matching_author(self, parser: CodeRabbitParser) -> None:
-        """Test that non-matching authors are rejected."""
-        assert parser.can_parse("random-user", "") is False
-        assert parser.can_parse("github-bot", "") is False
-        assert parser.can_parse("", "") is False
-
-    def test_can_parse_non_matching_body(self, parser: CodeRabbitParser) -> None:
-        """Test that non-matching bodies are rejected."""
-        assert parser.can_parse("random-user", "Regular comment body") is False
-        assert parser.can_parse("random-user", "Some other review tool") is False
-
-
-class TestCodeRabbitParserReviewerType:
-    """Tests for CodeRabbitParser.reviewer_type property."""
-
-    def test_reviewer_type_returns_coderabbit(self) -> None:
-        """Test that reviewer_type returns CODERABBIT."""
-        parser = CodeRabbitParser()
-        assert parser.reviewer_type == ReviewerType.CODERABBIT
-
-
-class TestCodeRabbitParserCritical:
-    """Tests for Critical severity classification."""
-
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
-
-    def test_parse_critical_severity(self, parser: CodeRabbitParser) -> None:
-        """Test Critical severity detection with emoji pattern."""
-        # Using the exact Unicode characters from the parser
-        body = "_\u26a0\ufe0f Potential issue_ | _\U0001f534 Critical_\n\nThis is critical."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.CRITICAL
-        assert requires_investigation is False
-
-    def test_parse_critical_severity_case_insensitive(self, parser: CodeRabbitParser) -> None:
-        """Test Critical severity with different case."""
-        body = "_\u26a0\ufe0f potential issue_ | _\U0001f534 critical_"
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.CRITICAL
-        assert requires_investigation is False
-
-
-class TestCodeRabbitParserMajor:
-    """Tests for Major severity classification."""
-
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
-
-    def test_parse_major_severity(self, parser: CodeRabbitParser) -> None:
-        """Test Major severity detection with emoji pattern."""
-        # Using the exact Unicode characters from the parser
-        body = "_\u26a0\ufe0f Potential issue_ | _\U0001f7e0 Major_\n\nThis is a major issue."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.MAJOR
-        assert requires_investigation is False
-
-    def test_parse_major_severity_case_insensitive(self, parser: CodeRabbitParser) -> None:
-        """Test Major severity with different case."""
-        body = "_\u26a0\ufe0f POTENTIAL ISSUE_ | _\U0001f7e0 MAJOR_"
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.MAJOR
-        assert requires_investigation is False
-
-
-class TestCodeRabbitParserMinor:
-    """Tests for Minor severity classification."""
-
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
-
-    def test_parse_minor_severity(self, parser: CodeRabbitParser) -> None:
-        """Test Minor severity detection with emoji pattern."""
-        # Using the exact Unicode characters from the parser
-        body = "_\u26a0\ufe0f Potential issue_ | _\U0001f7e1 Minor_\n\nThis is a minor issue."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.MINOR
-        assert requires_investigation is False
-
-
-class TestCodeRabbitParserTrivial:
-    """Tests for Trivial severity classification."""
-
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
-
-    def test_parse_trivial_severity(self, parser: CodeRabbitParser) -> None:
-        """Test Trivial severity detection."""
-        body = "_\U0001f535 Trivial_\n\nThis is a trivial comment."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.TRIVIAL
-        assert requires_investigation is False
-
-
-class TestCodeRabbitParserNitpick:
-    """Tests for Nitpick classification."""
-
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
-
-    def test_parse_nitpick(self, parser: CodeRabbitParser) -> None:
-        """Test Nitpick detection."""
-        body = "_\U0001f9f9 Nitpick_\n\nThis is a nitpick comment."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.TRIVIAL
-        assert requires_investigation is False
-
-
-class TestCodeRabbitParserFingerprint:
-    """Tests for fingerprinting comment detection."""
-
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
-
-    def test_parse_fingerprint_comment(self, parser: CodeRabbitParser) -> None:
-        """Test fingerprinting comment detection."""
-        body = "<!-- fingerprinting: some-metadata -->"
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.UNKNOWN
-        assert requires_investigation is False
-
-    def test_fingerprint_takes_precedence_over_severity(self, parser: CodeRabbitParser) -> None:
-        """Test that fingerprinting comments override severity patterns."""
-        # A comment that has both fingerprint and critical should be NON_ACTIONABLE
-        body = (
-            "<!-- fingerprinting: metadata -->"
-            "_\u26a0\ufe0f Potential issue_ | _\U0001f534 Critical_"
-        )
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.UNKNOWN
-
-
-class TestCodeRabbitParserAddressed:
-    """Tests for Addressed marker detection."""
-
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
-
-    def test_parse_addressed_marker(self, parser: CodeRabbitParser) -> None:
-        """Test Addressed marker detection."""
-        body = "\u2705 Addressed\n\nThe issue has been resolved."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.UNKNOWN
-        assert requires_investigation is False
-
-    def test_addressed_takes_precedence_over_severity(self, parser: CodeRabbitParser) -> None:
-        """Test that Addressed marker overrides severity patterns."""
-        body = "\u2705 Addressed\n_\u26a0\ufe0f Potential issue_ | _\U0001f534 Critical_"
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-
-
-class TestCodeRabbitParserOutsideDiffRange:
-    """Tests for Outside diff range detection."""
-
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
-
-    def test_parse_outside_diff_range(self, parser: CodeRabbitParser) -> None:
-        """Test Outside diff range detection."""
-        body = "Outside diff range: This comment refers to code not in this PR."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.MINOR
-        assert requires_investigation is False
-
-    def test_outside_diff_range_case_insensitive(self, parser: CodeRabbitParser) -> None:
-        """Test Outside diff range with different case."""
-        body = "OUTSIDE DIFF RANGE: some comment"
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.MINOR
-
-
-class TestCodeRabbitParserAmbiguous:
-    """Tests for ambiguous comment handling."""
-
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
-
-    def test_parse_empty_body(self, parser: CodeRabbitParser) -> None:
-        """Test empty body results in AMBIGUOUS."""
-        comment = {"body": ""}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.AMBIGUOUS
-        assert priority == Priority.UNKNOWN
-        assert requires_investigation is True
-
-    def test_parse_missing_body(self, parser: CodeRabbitParser) -> None:
-        """Test missing body key results in AMBIGUOUS."""
-        comment = {}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.AMBIGUOUS
-        assert priority == Priority.UNKNOWN
-        assert requires_investigation is True
-
-    def test_parse_unrecognized_pattern(self, parser: CodeRabbitParser) -> None:
-        """Test unrecognized body pattern results in AMBIGUOUS."""
-        comment = {"body": "This is a regular comment without any markers."}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.AMBIGUOUS
-        assert priority == Priority.UNKNOWN
-        assert requires_investigation is True
-
-
-class TestCodeRabbitParserPrecedence:
-    """Tests for pattern precedence rules."""
-
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
-
-    def test_critical_over_major(self, parser: CodeRabbitParser) -> None:
-        """Test Critical severity takes precedence over Major."""
-        body = (
-            "_\u26a0\ufe0f Potential issue_ | _\U0001f534 Critical_\n"
-            "_\u26a0\ufe0f Potential issue_ | _\U0001f7e0 Major_"
-        )
-        comment = {"body": body}
-        classification, priority, _ = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.CRITICAL
-
-    def test_major_over_minor(self, parser: CodeRabbitParser) -> None:
-        """Test Major severity takes precedence over Minor when first."""
-        body = (
-            "_\u26a0\ufe0f Potential issue_ | _\U0001f7e0 Major_\n"
-            "_\u26a0\ufe0f Potential issue_ | _\U0001f7e1 Minor_"
-        )
-        comment = {"body": body}
-        classification, priority, _ = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.MAJOR
-
-    def test_severity_over_trivial(self, parser: CodeRabbitParser) -> None:
-        """Test severity patterns take precedence over trivial."""
-        body = "_\u26a0\ufe0f Potential issue_ | _\U0001f7e1 Minor_\n" "_\U0001f535 Trivial_"
-        comment = {"body": body}
-        classification, priority, _ = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.MINOR
-
-
-class TestCodeRabbitParserSummaryPatterns:
-    """Tests for summary/walkthrough and tip content detection."""
-
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
-
-    def test_walkthrough_header_is_non_actionable(self, parser: CodeRabbitParser) -> None:
-        """Test ## Walkthrough header is classified as NON_ACTIONABLE."""
-        body = "## Walkthrough\n\nThis PR adds a feature."
-        comment = {"body": body}
-        classification, _, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert requires_investigation is False
-
-    def test_tip_callout_is_non_actionable(self, parser: CodeRabbitParser) -> None:
-        """Test > [!TIP] is classified as NON_ACTIONABLE."""
-        body = "> [!TIP]\n> Use this method."
-        comment = {"body": body}
-        classification, _, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert requires_investigation is False
-
-    def test_mermaid_is_non_actionable(self, parser: CodeRabbitParser) -> None:
-        """Test mermaid diagrams are NON_ACTIONABLE."""
-        body = "```mermaid\ndiagram\n```"
-        comment = {"body": body}
-        classification, _, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert requires_investigation is False
-
-    def test_is_summary_content_no_match(self, parser: CodeRabbitParser) -> None:
-        """Test _is_summary_content returns False for non-matching text."""
-        assert parser._is_summary_content("Regular text") is False
-
-    def test_is_tip_content_no_match(self, parser: CodeRabbitParser) -> None:
-        """Test _is_tip_content returns False for non-matching text."""
-        assert parser._is_tip_content("> Quote") is False
-
-    def test_inline_comment_with_walkthrough_is_non_actionable(
-        self, parser: CodeRabbitParser
-    ) -> None:
-        """Test inline comment with walkthrough content is NON_ACTIONABLE.
-
-        Even inline comments (with path set) that contain walkthrough/summary
-        content should be NON_ACTIONABLE - this tests the body-level check.
-        """
-        body = "## Walkthrough\n\nThis summarizes the changes."
-        comment = {"body": body, "path": "src/file.py", "line": 42}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert requires_investigation is False
-
-
-class TestCodeRabbitParserPRLevelSummaryComments:
-    """Tests for PR-level summary comment detection.
-
-    PR-level summary comments are posted by CodeRabbit at the PR level (not inline)
-    and contain overview information. These should be classified as NON_ACTIONABLE
-    because the actual actionable items are in inline comments.
-    """
-
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
-
-    def test_pr_summary_with_actionable_comments_count(self, parser: CodeRabbitParser) -> None:
-        """Test PR-level summary with 'Actionable comments posted: N' is NON_ACTIONABLE.
-
-        This is the main summary comment posted by CodeRabbit. Even when it says
-        'Actionable comments posted: 1', the summary itself is not actionable -
-        the inline comments are.
-        """
-        body = """<!-- This is an auto-generated comment by CodeRabbit -->
+# Expected (classification, priority, requires_investigation) results.
+EXPECTED_CRITICAL = (CommentClassification.ACTIONABLE, Priority.CRITICAL, False)
+EXPECTED_MAJOR = (CommentClassification.ACTIONABLE, Priority.MAJOR, False)
+EXPECTED_MINOR = (CommentClassification.ACTIONABLE, Priority.MINOR, False)
+EXPECTED_NON_ACTIONABLE = (CommentClassification.NON_ACTIONABLE, Priority.UNKNOWN, False)
+EXPECTED_AMBIGUOUS = (CommentClassification.AMBIGUOUS, Priority.UNKNOWN, True)
+
+# Representative CodeRabbit comment bodies, built once at import time.
+CRITICAL_MARKER = "_\u26a0\ufe0f Potential issue_ | _\U0001f534 Critical_"
+MAJOR_MARKER = "_\u26a0\ufe0f Potential issue_ | _\U0001f7e0 Major_"
+MINOR_MARKER = "_\u26a0\ufe0f Potential issue_ | _\U0001f7e1 Minor_"
+TRIVIAL_MARKER = "_\U0001f535 Trivial_"
+NITPICK_MARKER = "_\U0001f9f9 Nitpick_"
+ADDRESSED_MARKER = "\u2705 Addressed"
+
+CRITICAL_BODY = CRITICAL_MARKER + "\n\nThis is critical."
+MAJOR_BODY = MAJOR_MARKER + "\n\nThis is a major issue."
+MINOR_BODY = MINOR_MARKER + "\n\nThis is a minor issue."
+TRIVIAL_BODY = TRIVIAL_MARKER + "\n\nThis is a trivial comment."
+NITPICK_BODY = NITPICK_MARKER + "\n\nThis is a nitpick comment."
+ADDRESSED_BODY = ADDRESSED_MARKER + "\n\nThe issue has been resolved."
+FINGERPRINT_BODY = "<!-- fingerprinting: some-metadata -->"
+PR_SUMMARY_BODY = """<!-- This is an auto-generated comment by CodeRabbit -->
 
 ## Summary
 
@@ -440,15 +59,7 @@ This PR adds feature X.
 |------|---------|
 | foo.py | Added function |
 """
-        comment = {"body": body, "path": None, "line": None}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert requires_investigation is False
-
-    def test_pr_summary_with_zero_actionable_comments(self, parser: CodeRabbitParser) -> None:
-        """Test PR-level summary with 'Actionable comments posted: 0' is NON_ACTIONABLE."""
-        body = """<!-- This is an auto-generated comment by CodeRabbit -->
+PR_SUMMARY_ZERO_ACTIONABLE_BODY = """<!-- This is an auto-generated comment by CodeRabbit -->
 
 Actionable comments posted: 0
 
@@ -456,15 +67,7 @@ Actionable comments posted: 0
 
 No issues found in this PR.
 """
-        comment = {"body": body, "path": None, "line": None}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert requires_investigation is False
-
-    def test_pr_summary_with_details_sections(self, parser: CodeRabbitParser) -> None:
-        """Test PR-level summary with <details> sections is NON_ACTIONABLE."""
-        body = """<!-- This is an auto-generated comment by CodeRabbit -->
+PR_SUMMARY_DETAILS_BODY = """<!-- This is an auto-generated comment by CodeRabbit -->
 
 <details>
 <summary>Summary by CodeRabbit</summary>
@@ -475,33 +78,7 @@ No issues found in this PR.
 
 Actionable comments posted: 2
 """
-        comment = {"body": body, "path": None, "line": None}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert requires_investigation is False
-
-    def test_inline_comment_with_actionable_pattern_not_filtered(
-        self, parser: CodeRabbitParser
-    ) -> None:
-        """Test inline comment containing 'Actionable comments' pattern is NOT filtered.
-
-        Inline comments (with path/line) should never be filtered by summary detection,
-        even if they happen to contain similar text patterns.
-        """
-        body = """The previous summary said "Actionable comments posted: 1" but this
-inline comment is addressing the actual issue."""
-        comment = {"body": body, "path": "src/file.py", "line": 42}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        # Should NOT be filtered - this is an inline comment
-        # Without severity markers, it should be AMBIGUOUS
-        assert classification == CommentClassification.AMBIGUOUS
-        assert requires_investigation is True
-
-    def test_pr_summary_walkthrough_only(self, parser: CodeRabbitParser) -> None:
-        """Test PR-level summary with only Walkthrough section is NON_ACTIONABLE."""
-        body = """## Walkthrough
+PR_SUMMARY_WALKTHROUGH_BODY = """## Walkthrough
 
 The changes introduce a new parser module for handling Greptile comments.
 
@@ -511,194 +88,533 @@ The changes introduce a new parser module for handling Greptile comments.
 |------|---------|
 | parser.py | New parser implementation |
 """
-        comment = {"body": body, "path": None, "line": None}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert requires_investigation is False
-
-    def test_pr_summary_with_coderabbit_signature(self, parser: CodeRabbitParser) -> None:
-        """Test PR-level summary with CodeRabbit signature HTML comment."""
-        body = """<!-- This is an auto-generated comment by CodeRabbit -->
+PR_SUMMARY_SIGNATURE_BODY = """<!-- This is an auto-generated comment by CodeRabbit -->
 
 ## Summary
 
 This PR looks good overall.
 """
-        comment = {"body": body, "path": None, "line": None}
-        classification, priority, requires_investigation = parser.parse(comment)
+PR_SUMMARY_SHORT_BODY = (
+    "<!-- This is an auto-generated comment by CodeRabbit -->\n\nActionable comments posted: 1"
+)
+
+
+# "Outside diff range comments" review section; items are separated by blank lines.
+OUTSIDE_DIFF_HEADER = "<details>\n<summary>\u26a0\ufe0f {title} ({count})</summary>\n\n"
+OUTSIDE_DIFF_FOOTER = "\n\n</details>\n"
+
+
+def outside_diff_body(
+    *items: str, title: str = "Outside diff range comments", count: Optional[int] = None
+) -> str:
+    """Build a review body whose outside diff section holds the given items."""
+    header = OUTSIDE_DIFF_HEADER.format(title=title, count=len(items) if count is None else count)
+    return header + "\n\n".join(items) + OUTSIDE_DIFF_FOOTER
+
+
+def pr_comment(body: str) -> MappingProxyType:
+    """Build a read-only PR-level comment (no path/line) for the given body."""
+    return MappingProxyType({"body": body, "path": None, "line": None})
+
+
+def inline_comment(
+    body: str, path: str = "src/file.py", line: int = 42, **fields: Any
+) -> MappingProxyType:
+    """Build a read-only inline comment, with any extra fields such as is_resolved."""
+    return MappingProxyType({"body": body, "path": path, "line": line, **fields})
+
+
+@pytest.fixture(scope="module")
+def parser(coderabbit_parser: CodeRabbitParser) -> CodeRabbitParser:
+    """Return the shared CodeRabbitParser from the parsers conftest."""
+    return coderabbit_parser
+
+
+# Casefolded substrings that any CodeRabbit signature or classification
+# marker needs; text containing none of them is unrecognized.
+MARKER_FRAGMENTS = (
+    "<!--",
+    "\u2705",
+    "\U0001f534",
+    "\U0001f7e0",
+    "\U0001f7e1",
+    "\U0001f535",
+    "\U0001f9f9",
+    "outside diff range",
+    "thank",
+    "##",
+    "|",
+    "```",
+    "[!",
+)
+
+unmarked_text = st.text().filter(
+    lambda text: not any(fragment in text.casefold() for fragment in MARKER_FRAGMENTS)
+)
+
+
+CAN_PARSE_CASES = [
+    pytest.param("coderabbitai[bot]", "", True, id="author-exact"),
+    pytest.param("CODERABBITAI[bot]", "", False, id="author-uppercase"),
+    pytest.param("CodeRabbitAI[bot]", "", False, id="author-mixed-case"),
+    pytest.param(
+        "other-user",
+        "<!-- This is an auto-generated comment by coderabbit.ai -->",
+        True,
+        id="body-signature",
+    ),
+    pytest.param(
+        "other-user",
+        "<!-- This is an auto-generated comment by CodeRabbit.AI -->",
+        True,
+        id="body-signature-mixed-case",
+    ),
+    pytest.param(
+        "other-user",
+        "Review notes\n\n" + "details\n" * 1000 + "<!-- This is an auto-generated comment "
+        "by coderabbit.ai -->",
+        True,
+        id="body-signature-trailing",
+    ),
+    pytest.param(
+        "other-user",
+        "This is an auto-generated comment by coderabbit.ai",
+        False,
+        id="signature-text-outside-html-comment",
+    ),
+    pytest.param(
+        "other-user",
+        "<!-- This is an auto-generated comment: release notes\nby coderabbit.ai -->",
+        True,
+        id="body-signature-multiline",
+    ),
+    pytest.param(
+        "other-user",
+        "by coderabbit.ai --> <!-- This is an auto-generated comment -->",
+        False,
+        id="signature-end-before-start",
+    ),
+    pytest.param("other-user", "<!-- some other tool -->", False, id="other-html-comment"),
+    pytest.param("random-user", "", False, id="other-author"),
+    pytest.param("github-bot", "", False, id="other-bot"),
+    pytest.param("", "", False, id="empty-author"),
+    pytest.param("random-user", "Regular comment body", False, id="other-body"),
+    pytest.param("random-user", "Some other review tool", False, id="other-tool-body"),
+]
 
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert requires_investigation is False
 
-    def test_is_pr_summary_comment_returns_false_for_inline(self, parser: CodeRabbitParser) -> None:
-        """Test _is_pr_summary_comment returns False when path is set."""
-        body = (
-            "<!-- This is an auto-generated comment by CodeRabbit -->\n\n"
-            "Actionable comments posted: 1"
-        )
-        comment = {"body": body, "path": "src/file.py", "line": 10}
-        assert parser._is_pr_summary_comment(comment) is False
+class TestCodeRabbitParserCanParse:
+    """Tests for CodeRabbitParser.can_parse() method."""
 
-    def test_is_pr_summary_comment_returns_true_for_pr_level(
-        self, parser: CodeRabbitParser
+    @pytest.mark.parametrize("author,body,expected", CAN_PARSE_CASES)
+    def test_can_parse(
+        self, parser: CodeRabbitParser, author: str, body: str, expected: bool
     ) -> None:
-        """Test _is_pr_summary_comment returns True for PR-level summary."""
-        body = (
-            "<!-- This is an auto-generated comment by CodeRabbit -->\n\n"
-            "Actionable comments posted: 1"
-        )
-        comment = {"body": body, "path": None, "line": None}
-        assert parser._is_pr_summary_comment(comment) is True
+        """Test detection by exact (case-sensitive) author or case-insensitive body signature."""
+        assert parser.can_parse(author, body) is expected
 
-    def test_is_pr_summary_comment_with_actionable_count_pattern(
-        self, parser: CodeRabbitParser
+    @given(author=st.text().filter(lambda a: a != "coderabbitai[bot]"), body=unmarked_text)
+    def test_can_parse_rejects_unmarked_comments(
+        self, parser: CodeRabbitParser, author: str, body: str
     ) -> None:
-        """Test _is_pr_summary_comment detects 'Actionable comments posted:' pattern."""
-        comment = {
-            "body": "Actionable comments posted: 3\n\n## Walkthrough",
-            "path": None,
-            "line": None,
-        }
-        assert parser._is_pr_summary_comment(comment) is True
+        """Test arbitrary authors and bodies without a signature are not claimed."""
+        assert parser.can_parse(author, body) is False
 
-    def test_pr_summary_not_filtered_when_has_severity_marker_inline(
-        self, parser: CodeRabbitParser
-    ) -> None:
-        """Test inline comment with severity marker is still classified correctly.
 
-        Even though the comment might quote summary text, if it has a severity
-        marker and is inline, it should be classified by the severity.
-        """
-        body = "_\u26a0\ufe0f Potential issue_ | _\U0001f534 Critical_\n\nThis is critical."
-        comment = {"body": body, "path": "src/file.py", "line": 42}
-        classification, priority, requires_investigation = parser.parse(comment)
+class TestCodeRabbitParserReviewerType:
+    """Tests for CodeRabbitParser.reviewer_type property."""
 
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.CRITICAL
-        assert requires_investigation is False
+    def test_reviewer_type_returns_coderabbit(self, parser: CodeRabbitParser) -> None:
+        """Test that reviewer_type returns CODERABBIT."""
+        assert parser.reviewer_type is ReviewerType.CODERABBIT
 
 
-class TestCodeRabbitParserAcknowledgments:
-    """Tests for CodeRabbit acknowledgment/thank-you pattern detection."""
+class TestCodeRabbitParserStateless:
+    """Tests guarding the shared-fixture assumption that the parser holds no state."""
 
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
+    def test_parsing_does_not_mutate_parser(self, parser: CodeRabbitParser) -> None:
+        """Test parse() and parse_outside_diff_comments() leave no instance state behind."""
+        before = dict(vars(parser))
 
-    def test_parse_thank_you_for_fix(self, parser: CodeRabbitParser) -> None:
-        """Test thank-you acknowledgment for fix is NON_ACTIONABLE."""
-        body = "`@dsifry` Thank you for the fix!"
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
+        parser.parse(pr_comment(CRITICAL_BODY))
+        parser.parse(pr_comment(PR_SUMMARY_BODY))
+        parser.parse_outside_diff_comments(
+            "<details>\n<summary>Outside diff range comments (1)</summary>\n\n"
+            "**src/a.py:1**: Fix.\n\n</details>",
+            review_id="1",
+            author="coderabbitai[bot]",
+        )
 
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert requires_investigation is False
+        assert vars(parser) == before
 
-    def test_parse_thank_you_for_addressing(self, parser: CodeRabbitParser) -> None:
-        """Test thank-you for addressing is NON_ACTIONABLE."""
-        body = "`@dsifry` Thank you for addressing this!"
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
 
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert requires_investigation is False
+class TestCodeRabbitParserBodyCache:
+    """Tests for memoized body classification."""
 
-    def test_parse_thank_you_for_catch(self, parser: CodeRabbitParser) -> None:
-        """Test thank-you for catch is NON_ACTIONABLE."""
-        body = "@username Thank you for the catch! The fix looks good."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
+    def test_repeated_body_hits_cache(self, parser: CodeRabbitParser) -> None:
+        """Test parsing an identical body twice reuses the cached classification."""
+        body = NITPICK_BODY + "\n\nbody-cache-test"
+        hits = coderabbit._classify_body.cache_info().hits
 
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert requires_investigation is False
+        first = parser.parse(inline_comment(body))
+        second = parser.parse(inline_comment(body, path="src/other.py", line=7))
 
-    def test_parse_thank_you_for_suggestion(self, parser: CodeRabbitParser) -> None:
-        """Test thank-you for suggestion is NON_ACTIONABLE."""
-        body = "`@user`, thank you for the suggestion. We'll incorporate it."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
+        assert first == second
+        assert coderabbit._classify_body.cache_info().hits == hits + 1
 
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert requires_investigation is False
+    def test_cache_does_not_keep_parser_alive(self) -> None:
+        """Test a dropped parser instance is not retained by the body cache."""
+        parser = CodeRabbitParser()
+        parser.parse(inline_comment(NITPICK_BODY + "\n\nparser-lifetime-test"))
+        parser_ref = weakref.ref(parser)
+
+        del parser
+        gc.collect()
+
+        assert parser_ref() is None
+
+    def test_pr_summary_check_is_not_cached_by_body(self, parser: CodeRabbitParser) -> None:
+        """Test the path-dependent PR summary rule still applies after a cached inline parse."""
+        body = "Actionable comments posted: 2\n\nbody-cache-test"
+
+        assert parser.parse(inline_comment(body)) == EXPECTED_AMBIGUOUS
+        assert parser.parse(pr_comment(body)) == EXPECTED_NON_ACTIONABLE
+
+
+class TestCodeRabbitParserParseMany:
+    """Tests for batch parsing."""
+
+    def test_parse_many_preserves_order_and_classification(self, parser: CodeRabbitParser) -> None:
+        """Test parse_many returns one result per comment, in input order."""
+        comments = [
+            inline_comment(CRITICAL_BODY),
+            inline_comment("Could you explain this change?"),
+            inline_comment(ADDRESSED_BODY),
+        ]
+
+        assert parser.parse_many(comments) == [
+            EXPECTED_CRITICAL,
+            EXPECTED_AMBIGUOUS,
+            EXPECTED_NON_ACTIONABLE,
+        ]
+
+    def test_parse_many_empty(self, parser: CodeRabbitParser) -> None:
+        """Test parse_many on no comments returns an empty list."""
+        assert parser.parse_many([]) == []
+
+
+# (severity marker, expected parse result); each is also checked in upper and lower case.
+SEVERITY_MARKERS = [
+    pytest.param(CRITICAL_BODY, EXPECTED_CRITICAL, id="critical"),
+    pytest.param(MAJOR_BODY, EXPECTED_MAJOR, id="major"),
+    pytest.param(MINOR_BODY, EXPECTED_MINOR, id="minor"),
+    pytest.param(
+        TRIVIAL_BODY, (CommentClassification.NON_ACTIONABLE, Priority.TRIVIAL, False), id="trivial"
+    ),
+    pytest.param(
+        NITPICK_BODY, (CommentClassification.NON_ACTIONABLE, Priority.TRIVIAL, False), id="nitpick"
+    ),
+]
+
+
+class TestCodeRabbitParserSeverity:
+    """Tests for severity marker classification."""
+
+    @pytest.mark.parametrize(
+        "case",
+        [
+            pytest.param(str, id="as-is"),
+            pytest.param(str.lower, id="lower"),
+            pytest.param(str.upper, id="upper"),
+        ],
+    )
+    @pytest.mark.parametrize("body,expected", SEVERITY_MARKERS)
+    def test_parse_severity(
+        self,
+        parser: CodeRabbitParser,
+        body: str,
+        expected: tuple[CommentClassification, Priority, bool],
+        case: Callable[[str], str],
+    ) -> None:
+        """Test each severity marker is recognized regardless of letter case."""
+        assert parser.parse(pr_comment(case(body))) == expected
+
+
+# (comment, expected parse result) for every other classification rule the parser applies.
+CLASSIFICATION_CASES = [
+    # Precedence when several severity markers are present
+    pytest.param(
+        pr_comment(CRITICAL_MARKER + "\n" + MAJOR_MARKER),
+        EXPECTED_CRITICAL,
+        id="critical-over-major",
+    ),
+    pytest.param(
+        pr_comment(MAJOR_MARKER + "\n" + MINOR_MARKER),
+        EXPECTED_MAJOR,
+        id="major-over-minor",
+    ),
+    pytest.param(
+        pr_comment(MINOR_MARKER + "\n" + TRIVIAL_MARKER),
+        EXPECTED_MINOR,
+        id="severity-over-trivial",
+    ),
+    # Precedence does not depend on where each marker appears in the body
+    pytest.param(
+        pr_comment(NITPICK_MARKER + "\n" + MINOR_MARKER),
+        EXPECTED_MINOR,
+        id="minor-after-nitpick",
+    ),
+    pytest.param(
+        pr_comment("Outside diff range: see below.\n" + MAJOR_BODY),
+        EXPECTED_MAJOR,
+        id="major-after-outside-diff",
+    ),
+    # Fingerprint and Addressed markers override severity
+    pytest.param(pr_comment(FINGERPRINT_BODY), EXPECTED_NON_ACTIONABLE, id="fingerprint"),
+    pytest.param(
+        pr_comment("<!-- fingerprinting: metadata -->" + CRITICAL_MARKER),
+        EXPECTED_NON_ACTIONABLE,
+        id="fingerprint-over-severity",
+    ),
+    pytest.param(pr_comment(ADDRESSED_BODY), EXPECTED_NON_ACTIONABLE, id="addressed"),
+    pytest.param(
+        pr_comment(ADDRESSED_MARKER + "\n" + CRITICAL_MARKER),
+        EXPECTED_NON_ACTIONABLE,
+        id="addressed-over-severity",
+    ),
+    # Outside diff range mentions
+    pytest.param(
+        pr_comment("Outside diff range: This comment refers to code not in this PR."),
+        EXPECTED_MINOR,
+        id="outside-diff-range",
+    ),
+    pytest.param(
+        pr_comment("OUTSIDE DIFF RANGE: some comment"),
+        EXPECTED_MINOR,
+        id="outside-diff-range-uppercase",
+    ),
+    # Summary, walkthrough and tip content
+    pytest.param(
+        pr_comment("## Walkthrough\n\nThis PR adds a feature."),
+        EXPECTED_NON_ACTIONABLE,
+        id="walkthrough-header",
+    ),
+    pytest.param(
+        pr_comment("> [!TIP]\n> Use this method."), EXPECTED_NON_ACTIONABLE, id="tip-callout"
+    ),
+    pytest.param(pr_comment("```mermaid\ndiagram\n```"), EXPECTED_NON_ACTIONABLE, id="mermaid"),
+    # Even inline comments with summary content are NON_ACTIONABLE (body-level check)
+    pytest.param(
+        inline_comment("## Walkthrough\n\nThis summarizes the changes."),
+        EXPECTED_NON_ACTIONABLE,
+        id="inline-walkthrough",
+    ),
+    # PR-level summary comments are NON_ACTIONABLE even when they report
+    # 'Actionable comments posted: N' - the inline comments are what need action
+    pytest.param(pr_comment(PR_SUMMARY_BODY), EXPECTED_NON_ACTIONABLE, id="pr-actionable-count"),
+    pytest.param(
+        pr_comment(PR_SUMMARY_ZERO_ACTIONABLE_BODY),
+        EXPECTED_NON_ACTIONABLE,
+        id="pr-zero-actionable",
+    ),
+    pytest.param(
+        pr_comment(PR_SUMMARY_DETAILS_BODY), EXPECTED_NON_ACTIONABLE, id="pr-details-sections"
+    ),
+    pytest.param(
+        pr_comment(PR_SUMMARY_WALKTHROUGH_BODY), EXPECTED_NON_ACTIONABLE, id="pr-walkthrough-only"
+    ),
+    pytest.param(
+        pr_comment(PR_SUMMARY_SIGNATURE_BODY),
+        EXPECTED_NON_ACTIONABLE,
+        id="pr-coderabbit-signature",
+    ),
+    # PR-level comments carrying Critical/Major markers are classified by severity
+    pytest.param(
+        pr_comment(PR_SUMMARY_BODY + MAJOR_BODY), EXPECTED_MAJOR, id="pr-summary-with-major"
+    ),
+    pytest.param(
+        pr_comment("## Walkthrough\n\n\U0001f534 Build status: red"),
+        EXPECTED_NON_ACTIONABLE,
+        id="pr-summary-with-bare-emoji",
+    ),
+    # Inline comments are never filtered by PR summary detection
+    pytest.param(
+        inline_comment(
+            'The previous summary said "Actionable comments posted: 1" but this\n'
+            "inline comment is addressing the actual issue."
+        ),
+        EXPECTED_AMBIGUOUS,
+        id="inline-actionable-count-not-filtered",
+    ),
+    pytest.param(
+        inline_comment(CRITICAL_BODY),
+        EXPECTED_CRITICAL,
+        id="inline-severity",
+    ),
+    # Nothing recognizable
+    pytest.param(pr_comment(""), EXPECTED_AMBIGUOUS, id="empty-body"),
+    pytest.param({}, EXPECTED_AMBIGUOUS, id="missing-body"),
+    pytest.param({"body": None}, EXPECTED_AMBIGUOUS, id="none-body"),
+    pytest.param(
+        pr_comment("This is a regular comment without any markers."),
+        EXPECTED_AMBIGUOUS,
+        id="unrecognized",
+    ),
+]
+
+
+class TestCodeRabbitParserClassification:
+    """Tests for the classification rules applied by CodeRabbitParser.parse()."""
+
+    @pytest.mark.parametrize("comment,expected", CLASSIFICATION_CASES)
+    def test_parse(
+        self,
+        parser: CodeRabbitParser,
+        comment: dict,
+        expected: tuple[CommentClassification, Priority, bool],
+    ) -> None:
+        """Test each comment shape maps to the expected parse result."""
+        assert parser.parse(comment) == expected
 
-    def test_parse_thank_you_updated_correctly(self, parser: CodeRabbitParser) -> None:
-        """Test thank-you mentioning 'updated correctly' is NON_ACTIONABLE."""
-        body = (
-            "`@dsifry`, thank you for the fix! The example output "
-            "now correctly reflects the recommended secure defaults."
-        )
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
+    @given(body=unmarked_text)
+    def test_parse_unmarked_body_is_ambiguous(self, parser: CodeRabbitParser, body: str) -> None:
+        """Test arbitrary inline bodies without any marker are AMBIGUOUS."""
+        assert parser.parse(inline_comment(body)) == EXPECTED_AMBIGUOUS
 
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert requires_investigation is False
 
-    def test_parse_thank_you_addressed(self, parser: CodeRabbitParser) -> None:
-        """Test thank-you saying issue was addressed is NON_ACTIONABLE."""
-        body = "`@dsifry` Thank you for addressing this! " "The updated defaults look much safer."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
+class TestCodeRabbitParserSummaryPatterns:
+    """Tests for summary/walkthrough and tip content helpers."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            pytest.param("Regular text", id="no-sentinel"),
+            pytest.param("### Notes\n| a | b |\n```python\n```", id="sentinels-only"),
+        ],
+    )
+    def test_is_summary_content_no_match(self, parser: CodeRabbitParser, text: str) -> None:
+        """Test _is_summary_content returns False for non-matching text."""
+        assert parser._is_summary_content(text) is False
+
+    def test_is_summary_content_mid_body_header(self, parser: CodeRabbitParser) -> None:
+        """Test summary headers are found on any line, not only at the start."""
+        assert parser._is_summary_content("Intro line\n\n## Walkthrough\nDetails") is True
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            pytest.param("> Quote", id="no-sentinel"),
+            pytest.param("> [!WARNING]\n> Careful.", id="other-callout"),
+        ],
+    )
+    def test_is_tip_content_no_match(self, parser: CodeRabbitParser, text: str) -> None:
+        """Test _is_tip_content returns False for non-matching text."""
+        assert parser._is_tip_content(text) is False
 
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert requires_investigation is False
 
-    def test_is_acknowledgment_returns_true(self, parser: CodeRabbitParser) -> None:
-        """Test _is_acknowledgment helper returns True for valid patterns."""
-        assert parser._is_acknowledgment("`@user` Thank you for the fix!") is True
-        assert parser._is_acknowledgment("Thank you for addressing this") is True
+class TestCodeRabbitParserPRLevelSummaryComments:
+    """Tests for PR-level summary comment detection helpers.
 
-    def test_is_acknowledgment_returns_false_for_non_acknowledgment(
+    PR-level summary comments are posted by CodeRabbit at the PR level (not inline)
+    and contain overview information. These should be classified as NON_ACTIONABLE
+    because the actual actionable items are in inline comments.
+    """
+
+    def test_is_pr_summary_comment_returns_false_for_inline(self, parser: CodeRabbitParser) -> None:
+        """Test _is_pr_summary_comment returns False when path is set."""
+        comment = inline_comment(PR_SUMMARY_SHORT_BODY, line=10)
+        assert parser._is_pr_summary_comment(comment) is False
+
+    def test_is_pr_summary_comment_returns_true_for_pr_level(
         self, parser: CodeRabbitParser
     ) -> None:
-        """Test _is_acknowledgment returns False for non-acknowledgment content."""
-        assert parser._is_acknowledgment("This needs to be fixed") is False
-        assert parser._is_acknowledgment("Please address this issue") is False
+        """Test _is_pr_summary_comment returns True for PR-level summary."""
+        comment = pr_comment(PR_SUMMARY_SHORT_BODY)
+        assert parser._is_pr_summary_comment(comment) is True
+
+    def test_is_pr_summary_comment_with_actionable_count_pattern(
+        self, parser: CodeRabbitParser
+    ) -> None:
+        """Test _is_pr_summary_comment detects 'Actionable comments posted:' pattern."""
+        comment = pr_comment("Actionable comments posted: 3\n\n## Walkthrough")
+        assert parser._is_pr_summary_comment(comment) is True
+
+    def test_is_pr_summary_comment_requires_details_before_summary(
+        self, parser: CodeRabbitParser
+    ) -> None:
+        """Test the <details> marker only matches when the tags appear in order."""
+        assert parser._is_pr_summary_comment(pr_comment("<summary>x</summary><details>")) is False
+        assert parser._is_pr_summary_comment(pr_comment("<details><summary>x</summary>")) is True
+
+    def test_is_pr_summary_comment_returns_false_for_empty_body(
+        self, parser: CodeRabbitParser
+    ) -> None:
+        """Test _is_pr_summary_comment returns False for an empty PR-level body."""
+        assert parser._is_pr_summary_comment(pr_comment("")) is False
+
+
+ACKNOWLEDGMENT_BODIES = [
+    pytest.param("`@dsifry` Thank you for the fix!", id="fix"),
+    pytest.param("`@dsifry` Thank you for addressing this!", id="addressing"),
+    pytest.param("@username Thank you for the catch! The fix looks good.", id="catch"),
+    pytest.param("`@user`, thank you for the suggestion. We'll incorporate it.", id="suggestion"),
+    pytest.param(
+        "`@dsifry`, thank you for the fix! The example output "
+        "now correctly reflects the recommended secure defaults.",
+        id="updated-correctly",
+    ),
+    pytest.param(
+        "`@dsifry` Thank you for addressing this! The updated defaults look much safer.",
+        id="addressed",
+    ),
+    # GitHub usernames can contain hyphens, and the pattern must match them.
+    pytest.param(
+        "`@foo-bar` Thank you for the fix! The changes look great.", id="hyphenated-username"
+    ),
+]
+
+IS_ACKNOWLEDGMENT_CASES = [
+    pytest.param("`@user` Thank you for the fix!", True, id="fix"),
+    pytest.param("Thank you for addressing this", True, id="no-mention"),
+    pytest.param("@foo-bar Thank you for the fix!", True, id="hyphenated-username"),
+    pytest.param(
+        "`@my-user-name` Thank you for the catch!", True, id="hyphenated-username-backticks"
+    ),
+    pytest.param("THANK YOU FOR ADDRESSING THIS", True, id="uppercase"),
+    pytest.param("This needs to be fixed", False, id="request"),
+    pytest.param("Please address this issue", False, id="please-address"),
+]
+
 
-    def test_parse_thank_you_hyphenated_username(self, parser: CodeRabbitParser) -> None:
-        """Test thank-you with hyphenated username is NON_ACTIONABLE.
+class TestCodeRabbitParserAcknowledgments:
+    """Tests for CodeRabbit acknowledgment/thank-you pattern detection."""
 
-        GitHub usernames can contain hyphens (e.g., 'foo-bar'), and the pattern
-        must match these correctly.
-        """
-        body = "`@foo-bar` Thank you for the fix! The changes look great."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
+    @pytest.mark.parametrize("body", ACKNOWLEDGMENT_BODIES)
+    def test_acknowledgment_is_non_actionable(self, parser: CodeRabbitParser, body: str) -> None:
+        """Test thank-you acknowledgments are NON_ACTIONABLE."""
+        classification, _, requires_investigation = parser.parse(pr_comment(body))
 
-        assert classification == CommentClassification.NON_ACTIONABLE
+        assert classification is CommentClassification.NON_ACTIONABLE
         assert requires_investigation is False
 
-    def test_is_acknowledgment_hyphenated_username(self, parser: CodeRabbitParser) -> None:
-        """Test _is_acknowledgment works with hyphenated usernames."""
-        assert parser._is_acknowledgment("@foo-bar Thank you for the fix!") is True
-        assert parser._is_acknowledgment("`@my-user-name` Thank you for the catch!") is True
+    @pytest.mark.parametrize("text,expected", IS_ACKNOWLEDGMENT_CASES)
+    def test_is_acknowledgment(self, parser: CodeRabbitParser, text: str, expected: bool) -> None:
+        """Test _is_acknowledgment helper against matching and non-matching content."""
+        assert parser._is_acknowledgment(text) is expected
 
 
 class TestCodeRabbitParserOutsideDiffComments:
     """Tests for parsing 'Outside diff range comments' from review bodies."""
 
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
-
     def test_parse_outside_diff_comments_single_item(self, parser: CodeRabbitParser) -> None:
         """Test parsing a single outside diff comment from review body."""
-        review_body = """
-## Summary
-
-Some review content here.
-
-<details>
-<summary>\u26a0\ufe0f Outside diff range comments (1)</summary>
-
-**src/config.py:42-45**: Consider adding validation for the config values.
-
-</details>
-
-Other content.
-"""
+        review_body = (
+            "## Summary\n\nSome review content here.\n\n"
+            + outside_diff_body(
+                "**src/config.py:42-45**: Consider adding validation for the config values."
+            )
+            + "\nOther content.\n"
+        )
         results = parser.parse_outside_diff_comments(
             review_body,
             review_id="123",
@@ -716,18 +632,11 @@ Other content.
 
     def test_parse_outside_diff_comments_multiple_items(self, parser: CodeRabbitParser) -> None:
         """Test parsing multiple outside diff comments from review body."""
-        review_body = """
-<details>
-<summary>\u26a0\ufe0f Outside diff range comments (3)</summary>
-
-**src/config.py:42-45**: Consider adding validation for the config values.
-
-**src/utils.py:100**: This function could use memoization for performance.
-
-**tests/test_main.py:15-20**: These tests should use fixtures.
-
-</details>
-"""
+        review_body = outside_diff_body(
+            "**src/config.py:42-45**: Consider adding validation for the config values.",
+            "**src/utils.py:100**: This function could use memoization for performance.",
+            "**tests/test_main.py:15-20**: These tests should use fixtures.",
+        )
         results = parser.parse_outside_diff_comments(
             review_body, review_id="456", author="coderabbitai[bot]"
         )
@@ -771,12 +680,7 @@ Everything looks good!
 
     def test_parse_outside_diff_comments_empty_section(self, parser: CodeRabbitParser) -> None:
         """Test returns empty list when section exists but has no items."""
-        review_body = """
-<details>
-<summary>\u26a0\ufe0f Outside diff range comments (0)</summary>
-
-</details>
-"""
+        review_body = outside_diff_body(count=0)
         results = parser.parse_outside_diff_comments(
             review_body, review_id="123", author="coderabbitai[bot]"
         )
@@ -785,16 +689,11 @@ Everything looks good!
 
     def test_parse_outside_diff_comments_multiline_body(self, parser: CodeRabbitParser) -> None:
         """Test parsing comment with multiline body text."""
-        review_body = """
-<details>
-<summary>\u26a0\ufe0f Outside diff range comments (1)</summary>
-
-**src/handler.py:50-55**: This error handling could be improved.
-You should consider catching specific exceptions rather than using a bare except.
-Also, logging the error would help with debugging.
-
-</details>
-"""
+        review_body = outside_diff_body(
+            "**src/handler.py:50-55**: This error handling could be improved.\n"
+            "You should consider catching specific exceptions rather than using a bare except.\n"
+            "Also, logging the error would help with debugging."
+        )
         results = parser.parse_outside_diff_comments(
             review_body, review_id="123", author="coderabbitai[bot]"
         )
@@ -807,14 +706,9 @@ Also, logging the error would help with debugging.
 
     def test_parse_outside_diff_comments_case_insensitive(self, parser: CodeRabbitParser) -> None:
         """Test parsing is case insensitive for section header."""
-        review_body = """
-<details>
-<summary>\u26a0\ufe0f OUTSIDE DIFF RANGE COMMENTS (1)</summary>
-
-**src/config.py:10**: Add a docstring here.
-
-</details>
-"""
+        review_body = outside_diff_body(
+            "**src/config.py:10**: Add a docstring here.", title="OUTSIDE DIFF RANGE COMMENTS"
+        )
         results = parser.parse_outside_diff_comments(
             review_body, review_id="123", author="coderabbitai[bot]"
         )
@@ -826,14 +720,9 @@ Also, logging the error would help with debugging.
         self, parser: CodeRabbitParser
     ) -> None:
         """Test parsing with singular 'comment' in header."""
-        review_body = """
-<details>
-<summary>\u26a0\ufe0f Outside diff range comment (1)</summary>
-
-**src/main.py:5**: Initialize this variable.
-
-</details>
-"""
+        review_body = outside_diff_body(
+            "**src/main.py:5**: Initialize this variable.", title="Outside diff range comment"
+        )
         results = parser.parse_outside_diff_comments(
             review_body, review_id="123", author="coderabbitai[bot]"
         )
@@ -845,14 +734,7 @@ Also, logging the error would help with debugging.
         self, parser: CodeRabbitParser
     ) -> None:
         """Test that review_url is preserved correctly."""
-        review_body = """
-<details>
-<summary>\u26a0\ufe0f Outside diff range comments (1)</summary>
-
-**src/config.py:1**: Add header.
-
-</details>
-"""
+        review_body = outside_diff_body("**src/config.py:1**: Add header.")
         url = "https://github.com/org/repo/pull/42#pullrequestreview-999"
         results = parser.parse_outside_diff_comments(
             review_body, review_id="999", author="coderabbitai[bot]", review_url=url
@@ -863,14 +745,7 @@ Also, logging the error would help with debugging.
 
     def test_parse_outside_diff_comments_no_review_url(self, parser: CodeRabbitParser) -> None:
         """Test that review_url can be None."""
-        review_body = """
-<details>
-<summary>\u26a0\ufe0f Outside diff range comments (1)</summary>
-
-**src/config.py:1**: Add header.
-
-</details>
-"""
+        review_body = outside_diff_body("**src/config.py:1**: Add header.")
         results = parser.parse_outside_diff_comments(
             review_body, review_id="123", author="coderabbitai[bot]", review_url=None
         )
@@ -882,14 +757,9 @@ Also, logging the error would help with debugging.
         self, parser: CodeRabbitParser
     ) -> None:
         """Test that returned objects are OutsideDiffComment instances."""
-        review_body = """
-<details>
-<summary>\u26a0\ufe0f Outside diff range comments (1)</summary>
-
-**src/config.py:42**: Check this.
+        from goodtogo.core.models import OutsideDiffComment
 
-</details>
-"""
+        review_body = outside_diff_body("**src/config.py:42**: Check this.")
         results = parser.parse_outside_diff_comments(
             review_body, review_id="123", author="coderabbitai[bot]"
         )
@@ -901,12 +771,8 @@ Also, logging the error would help with debugging.
         """Test that items with empty body are skipped."""
         # First item has no body text after the colon, second has content
         # Note: items must be separated by blank lines (double newline)
-        review_body = (
-            "<details>\n"
-            "<summary>\u26a0\ufe0f Outside diff range comments (2)</summary>\n\n"
-            "**src/config.py:42**:\n\n"
-            "**src/utils.py:10**: This has content.\n\n"
-            "</details>"
+        review_body = outside_diff_body(
+            "**src/config.py:42**:", "**src/utils.py:10**: This has content."
         )
         results = parser.parse_outside_diff_comments(
             review_body, review_id="123", author="coderabbitai[bot]"
@@ -917,98 +783,177 @@ Also, logging the error would help with debugging.
         assert results[0].file_path == "src/utils.py"
         assert results[0].body == "This has content."
 
+    def test_parse_outside_diff_comments_keeps_blank_lines_within_item(
+        self, parser: CodeRabbitParser
+    ) -> None:
+        """Test that an item's body runs until the next item, across blank lines."""
+        review_body = outside_diff_body(
+            "**src/config.py:42**: First paragraph.\n\nSecond paragraph.",
+            "**src/utils.py:10**: Next item.",
+            count=2,
+        )
+        results = parser.parse_outside_diff_comments(
+            review_body, review_id="123", author="coderabbitai[bot]"
+        )
+
+        assert [r.file_path for r in results] == ["src/config.py", "src/utils.py"]
+        assert results[0].body == "First paragraph.\n\nSecond paragraph."
+        assert results[1].body == "Next item."
+
+    @pytest.mark.parametrize(
+        "review_body",
+        [
+            pytest.param(
+                outside_diff_body("**src/a.py:1**: Check this.").replace("\n", "\r\n"),
+                id="crlf-line-endings",
+            ),
+            pytest.param(outside_diff_body("  **src/a.py:1**: Check this."), id="indented-item"),
+            pytest.param(
+                outside_diff_body("Intro text.\n**src/a.py:1**: Check this."),
+                id="intro-text-in-same-paragraph",
+            ),
+            pytest.param(
+                "<details>\n<summary>Outside diff range comments (1)</summary>\n \n"
+                "**src/a.py:1**: Check this.\n \n</details>",
+                id="whitespace-only-blank-lines",
+            ),
+        ],
+    )
+    def test_parse_outside_diff_comments_finds_item_in_loose_layout(
+        self, parser: CodeRabbitParser, review_body: str
+    ) -> None:
+        """Test that items are found regardless of line endings, indentation or preamble."""
+        results = parser.parse_outside_diff_comments(
+            review_body, review_id="123", author="coderabbitai[bot]"
+        )
+
+        assert [(r.file_path, r.line_range, r.body) for r in results] == [
+            ("src/a.py", "1", "Check this.")
+        ]
+
+    @pytest.mark.parametrize(
+        "review_body",
+        [
+            pytest.param(
+                "<DETAILS>\n<SUMMARY>Outside diff range comments (1)</SUMMARY>\n\n"
+                "**src/a.py:1**: Check this.\n\n</DETAILS>",
+                id="uppercase",
+            ),
+            pytest.param(
+                "<Details>\n<Summary>Outside diff range comments (1)</Summary>\n\n"
+                "**src/a.py:1**: Check this.\n\n</Details>",
+                id="mixed-case",
+            ),
+        ],
+    )
+    def test_parse_outside_diff_comments_tags_case_insensitive(
+        self, parser: CodeRabbitParser, review_body: str
+    ) -> None:
+        """Test that the section's HTML tags are matched regardless of case."""
+        results = parser.parse_outside_diff_comments(
+            review_body, review_id="123", author="coderabbitai[bot]"
+        )
+
+        assert [(r.file_path, r.body) for r in results] == [("src/a.py", "Check this.")]
+
+    def test_parse_outside_diff_comments_ignores_text_before_first_item(
+        self, parser: CodeRabbitParser
+    ) -> None:
+        """Test that paragraphs preceding the first item are not attached to any item."""
+        review_body = outside_diff_body(
+            "Some preamble.", "**src/config.py:42**: Check this.\n\nMore detail."
+        )
+        results = parser.parse_outside_diff_comments(
+            review_body, review_id="123", author="coderabbitai[bot]"
+        )
+
+        assert [(r.file_path, r.body) for r in results] == [
+            ("src/config.py", "Check this.\n\nMore detail.")
+        ]
+
+    @pytest.mark.parametrize(
+        "review_body",
+        [
+            pytest.param(
+                "<details>\n<summary>Outside diff range comments (1)\n\n**src/a.py:1**: Fix.",
+                id="unterminated-summary",
+            ),
+            pytest.param(
+                "<details>\n<summary>Outside diff range comments (1)</summary>\n\n"
+                "**src/a.py:1**: Fix.",
+                id="unterminated-details",
+            ),
+            pytest.param(
+                "<summary>Outside diff range comments (1)</summary>\n\n"
+                "**src/a.py:1**: Fix.\n\n</details>",
+                id="summary-outside-details",
+            ),
+            pytest.param(
+                "<details>\n<summary>Outside diff range comments</summary>\n\n"
+                "**src/a.py:1**: Fix.\n\n</details>",
+                id="summary-without-count",
+            ),
+        ],
+    )
+    def test_parse_outside_diff_comments_incomplete_section(
+        self, parser: CodeRabbitParser, review_body: str
+    ) -> None:
+        """Test that malformed outside diff sections yield no comments."""
+        results = parser.parse_outside_diff_comments(
+            review_body, review_id="123", author="coderabbitai[bot]"
+        )
+
+        assert results == []
+
+    def test_parse_outside_diff_comments_after_other_details(
+        self, parser: CodeRabbitParser
+    ) -> None:
+        """Test the section is found after unrelated <details> blocks."""
+        review_body = (
+            "<details>\n<summary>Summary by CodeRabbit</summary>\n\n- Added feature\n</details>\n\n"
+            "<details>\n<summary>\u26a0\ufe0f Outside diff range comments (1)</summary>\n\n"
+            "**src/config.py:7**: Validate input.\n\n</details>"
+        )
+        results = parser.parse_outside_diff_comments(
+            review_body, review_id="123", author="coderabbitai[bot]"
+        )
+
+        assert [(r.file_path, r.line_range, r.body) for r in results] == [
+            ("src/config.py", "7", "Validate input.")
+        ]
+
 
 class TestCodeRabbitParserThreadResolution:
     """Tests for thread resolution handling (base class template method)."""
 
-    @pytest.fixture
-    def parser(self) -> CodeRabbitParser:
-        """Create a CodeRabbitParser instance."""
-        return CodeRabbitParser()
-
     def test_resolved_thread_overrides_critical_severity(self, parser: CodeRabbitParser) -> None:
         """Test that resolved threads return NON_ACTIONABLE even with Critical severity."""
-        comment = {
-            "body": (
-                "_\u26a0\ufe0f Potential issue_ | _\U0001f534 Critical_\n\n"
-                "Security vulnerability!"
-            ),
-            "is_resolved": True,
-            "path": "src/auth.py",
-            "line": 42,
-        }
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.UNKNOWN
-        assert requires_investigation is False
+        comment = inline_comment(CRITICAL_BODY, "src/auth.py", 42, is_resolved=True)
+        assert parser.parse(comment) == EXPECTED_NON_ACTIONABLE
 
     def test_resolved_thread_overrides_major_severity(self, parser: CodeRabbitParser) -> None:
         """Test that resolved threads return NON_ACTIONABLE even with Major severity."""
-        comment = {
-            "body": "_\u26a0\ufe0f Potential issue_ | _\U0001f7e0 Major_\n\nMissing validation.",
-            "is_resolved": True,
-            "path": "src/api.py",
-            "line": 100,
-        }
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.UNKNOWN
-        assert requires_investigation is False
+        comment = inline_comment(MAJOR_BODY, "src/api.py", 100, is_resolved=True)
+        assert parser.parse(comment) == EXPECTED_NON_ACTIONABLE
 
     def test_resolved_thread_overrides_minor_severity(self, parser: CodeRabbitParser) -> None:
         """Test that resolved threads return NON_ACTIONABLE even with Minor severity."""
-        comment = {
-            "body": "_\u26a0\ufe0f Potential issue_ | _\U0001f7e1 Minor_\n\nConsider refactoring.",
-            "is_resolved": True,
-            "path": "src/utils.py",
-            "line": 50,
-        }
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.UNKNOWN
-        assert requires_investigation is False
+        comment = inline_comment(MINOR_BODY, "src/utils.py", 50, is_resolved=True)
+        assert parser.parse(comment) == EXPECTED_NON_ACTIONABLE
 
     def test_outdated_thread_overrides_severity(self, parser: CodeRabbitParser) -> None:
         """Test that outdated threads return NON_ACTIONABLE regardless of severity."""
-        comment = {
-            "body": "_\u26a0\ufe0f Potential issue_ | _\U0001f534 Critical_\n\nFix this!",
-            "is_outdated": True,
-            "path": "src/critical.py",
-            "line": 10,
-        }
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.UNKNOWN
-        assert requires_investigation is False
+        comment = inline_comment(CRITICAL_BODY, "src/critical.py", 10, is_outdated=True)
+        assert parser.parse(comment) == EXPECTED_NON_ACTIONABLE
 
     def test_unresolved_thread_respects_severity(self, parser: CodeRabbitParser) -> None:
         """Test that unresolved threads still respect severity classification."""
-        comment = {
-            "body": "_\u26a0\ufe0f Potential issue_ | _\U0001f7e0 Major_\n\nNeed to fix.",
-            "is_resolved": False,
-            "is_outdated": False,
-            "path": "src/logic.py",
-            "line": 25,
-        }
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.MAJOR
-        assert requires_investigation is False
+        comment = inline_comment(
+            MAJOR_BODY, "src/logic.py", 25, is_resolved=False, is_outdated=False
+        )
+        assert parser.parse(comment) == EXPECTED_MAJOR
 
     def test_missing_resolution_flags_defaults_to_parsing(self, parser: CodeRabbitParser) -> None:
         """Test that missing is_resolved/is_outdated defaults to normal parsing."""
-        comment = {
-            "body": "_\u26a0\ufe0f Potential issue_ | _\U0001f7e1 Minor_\n\nShould improve.",
-            "path": "src/minor.py",
-            "line": 1,
-        }
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.MINOR
-        assert requires_investigation is False
+        comment = inline_comment(MINOR_BODY, "src/minor.py", 1)
+        assert parser.parse(comment) == EXPECTED_MINOR
@@ -12,14 +12,15 @@ from goodtogo.core.models import CommentClassification, Priority, ReviewerType
 from goodtogo.parsers.cursor import CursorBugbotParser
 
 
+@pytest.fixture(scope="module")
+def parser(cursor_parser: CursorBugbotParser) -> CursorBugbotParser:
+    """Return the shared CursorBugbotParser from the parsers conftest."""
+    return cursor_parser
+
+
 class TestCursorBugbotParserCanParse:
     """Tests for CursorBugbotParser.can_parse() method."""
 
-    @pytest.fixture
-    def parser(self) -> CursorBugbotParser:
-        """Create a CursorBugbotParser instance."""
-        return CursorBugbotParser()
-
     def test_can_parse_by_author_cursor_bot(self, parser: CursorBugbotParser) -> None:
         """Test detection by cursor[bot] author."""
         assert parser.can_parse("cursor[bot]", "") is True
@@ -65,136 +66,83 @@ class TestCursorBugbotParserReviewerType:
         parser = CursorBugbotParser()
         assert parser.reviewer_type == ReviewerType.CURSOR
 
-
-class TestCursorBugbotParserCriticalSeverity:
-    """Tests for Critical Severity classification."""
-
-    @pytest.fixture
-    def parser(self) -> CursorBugbotParser:
-        """Create a CursorBugbotParser instance."""
-        return CursorBugbotParser()
-
-    def test_parse_critical_severity(self, parser: CursorBugbotParser) -> None:
-        """Test Critical Severity detection."""
-        body = "Critical Severity: This issue must be fixed immediately."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.CRITICAL
-        assert requires_investigation is False
-
-    def test_parse_critical_severity_case_insensitive(self, parser: CursorBugbotParser) -> None:
-        """Test Critical Severity is case-insensitive."""
-        body = "CRITICAL SEVERITY: Security vulnerability detected."
-        comment = {"body": body}
-        classification, priority, _ = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.CRITICAL
-
-    def test_parse_critical_severity_with_whitespace(self, parser: CursorBugbotParser) -> None:
-        """Test Critical Severity with extra whitespace."""
-        body = "Critical   Severity: Issue found."
-        comment = {"body": body}
-        classification, priority, _ = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.CRITICAL
-
-
-class TestCursorBugbotParserHighSeverity:
-    """Tests for High Severity classification."""
-
-    @pytest.fixture
-    def parser(self) -> CursorBugbotParser:
-        """Create a CursorBugbotParser instance."""
-        return CursorBugbotParser()
-
-    def test_parse_high_severity(self, parser: CursorBugbotParser) -> None:
-        """Test High Severity detection."""
-        body = "High Severity: Must fix before merge."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.MAJOR
-        assert requires_investigation is False
-
-    def test_parse_high_severity_case_insensitive(self, parser: CursorBugbotParser) -> None:
-        """Test High Severity is case-insensitive."""
-        body = "HIGH SEVERITY: Data validation missing."
-        comment = {"body": body}
-        classification, priority, _ = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.MAJOR
-
-
-class TestCursorBugbotParserMediumSeverity:
-    """Tests for Medium Severity classification."""
-
-    @pytest.fixture
-    def parser(self) -> CursorBugbotParser:
-        """Create a CursorBugbotParser instance."""
-        return CursorBugbotParser()
-
-    def test_parse_medium_severity(self, parser: CursorBugbotParser) -> None:
-        """Test Medium Severity detection."""
-        body = "Medium Severity: Should fix this issue."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.MINOR
-        assert requires_investigation is False
-
-    def test_parse_medium_severity_case_insensitive(self, parser: CursorBugbotParser) -> None:
-        """Test Medium Severity is case-insensitive."""
-        body = "MEDIUM SEVERITY: Consider refactoring."
-        comment = {"body": body}
-        classification, priority, _ = parser.parse(comment)
-
-        assert classification == CommentClassification.ACTIONABLE
-        assert priority == Priority.MINOR
-
-
-class TestCursorBugbotParserLowSeverity:
-    """Tests for Low Severity classification."""
-
-    @pytest.fixture
-    def parser(self) -> CursorBugbotParser:
-        """Create a CursorBugbotParser instance."""
-        return CursorBugbotParser()
-
-    def test_parse_low_severity(self, parser: CursorBugbotParser) -> None:
-        """Test Low Severity detection."""
-        body = "Low Severity: Nice to fix but not required."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.TRIVIAL
-        assert requires_investigation is False
-
-    def test_parse_low_severity_case_insensitive(self, parser: CursorBugbotParser) -> None:
-        """Test Low Severity is case-insensitive."""
-        body = "LOW SEVERITY: Minor style improvement."
-        comment = {"body": body}
-        classification, priority, _ = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.TRIVIAL
+    def test_has_no_instance_dict(self, parser: CursorBugbotParser) -> None:
+        """Test the parser declares empty __slots__ all the way up its bases."""
+        assert not hasattr(parser, "__dict__")
+
+
+# (body, expected parse result) for each severity, as written and in upper case.
+SEVERITY_CASES = [
+    pytest.param(
+        "Critical Severity: This issue must be fixed immediately.",
+        (CommentClassification.ACTIONABLE, Priority.CRITICAL, False),
+        id="critical",
+    ),
+    pytest.param(
+        "CRITICAL SEVERITY: Security vulnerability detected.",
+        (CommentClassification.ACTIONABLE, Priority.CRITICAL, False),
+        id="critical-upper",
+    ),
+    pytest.param(
+        "Critical   Severity: Issue found.",
+        (CommentClassification.ACTIONABLE, Priority.CRITICAL, False),
+        id="critical-extra-whitespace",
+    ),
+    pytest.param(
+        "Critical\nSeverity: Issue found.",
+        (CommentClassification.ACTIONABLE, Priority.CRITICAL, False),
+        id="critical-line-break",
+    ),
+    pytest.param(
+        "High Severity: Must fix before merge.",
+        (CommentClassification.ACTIONABLE, Priority.MAJOR, False),
+        id="high",
+    ),
+    pytest.param(
+        "HIGH SEVERITY: Data validation missing.",
+        (CommentClassification.ACTIONABLE, Priority.MAJOR, False),
+        id="high-upper",
+    ),
+    pytest.param(
+        "Medium Severity: Should fix this issue.",
+        (CommentClassification.ACTIONABLE, Priority.MINOR, False),
+        id="medium",
+    ),
+    pytest.param(
+        "MEDIUM SEVERITY: Consider refactoring.",
+        (CommentClassification.ACTIONABLE, Priority.MINOR, False),
+        id="medium-upper",
+    ),
+    pytest.param(
+        "Low Severity: Nice to fix but not required.",
+        (CommentClassification.NON_ACTIONABLE, Priority.TRIVIAL, False),
+        id="low",
+    ),
+    pytest.param(
+        "LOW SEVERITY: Minor style improvement.",
+        (CommentClassification.NON_ACTIONABLE, Priority.TRIVIAL, False),
+        id="low-upper",
+    ),
+]
+
+
+class TestCursorBugbotParserSeverity:
+    """Tests for Critical/High/Medium/Low Severity classification."""
+
+    @pytest.mark.parametrize("body,expected", SEVERITY_CASES)
+    def test_parse_severity(
+        self,
+        parser: CursorBugbotParser,
+        body: str,
+        expected: tuple[CommentClassification, Priority, bool],
+    ) -> None:
+        """Test each severity maps to its classification and priority, in any case."""
+        assert parser.parse({"body": body}) == expected
 
 
 class TestCursorBugbotParserAmbiguous:
     """Tests for ambiguous comment handling."""
 
-    @pytest.fixture
-    def parser(self) -> CursorBugbotParser:
-        """Create a CursorBugbotParser instance."""
-        return CursorBugbotParser()
-
     def test_parse_empty_body(self, parser: CursorBugbotParser) -> None:
         """Test empty body results in AMBIGUOUS."""
         comment = {"body": ""}
@@ -213,6 +161,15 @@ class TestCursorBugbotParserAmbiguous:
         assert priority == Priority.UNKNOWN
         assert requires_investigation is True
 
+    def test_parse_none_body(self, parser: CursorBugbotParser) -> None:
+        """Test a null body results in AMBIGUOUS."""
+        comment = {"body": None}
+        classification, priority, requires_investigation = parser.parse(comment)
+
+        assert classification == CommentClassification.AMBIGUOUS
+        assert priority == Priority.UNKNOWN
+        assert requires_investigation is True
+
     def test_parse_unrecognized_pattern(self, parser: CursorBugbotParser) -> None:
         """Test unrecognized body pattern results in AMBIGUOUS."""
         comment = {"body": "Consider adding error handling here."}
@@ -235,11 +192,6 @@ class TestCursorBugbotParserAmbiguous:
 class TestCursorBugbotParserPrecedence:
     """Tests for severity pattern precedence rules."""
 
-    @pytest.fixture
-    def parser(self) -> CursorBugbotParser:
-        """Create a CursorBugbotParser instance."""
-        return CursorBugbotParser()
-
     def test_critical_over_high(self, parser: CursorBugbotParser) -> None:
         """Test Critical severity takes precedence over High."""
         body = "Critical Severity: Fix this.\nHigh Severity: Also this."
@@ -278,7 +230,7 @@ class TestCursorBugbotParserPrecedence:
         comment = {"body": body}
         classification, priority, _ = parser.parse(comment)
 
-        # Critical is checked first in _SEVERITY_PATTERNS
+        # Critical ranks first in _SEVERITY_RESULTS, regardless of body order
         assert classification == CommentClassification.ACTIONABLE
         assert priority == Priority.CRITICAL
 
@@ -286,11 +238,6 @@ class TestCursorBugbotParserPrecedence:
 class TestCursorBugbotParserEdgeCases:
     """Tests for edge cases and special scenarios."""
 
-    @pytest.fixture
-    def parser(self) -> CursorBugbotParser:
-        """Create a CursorBugbotParser instance."""
-        return CursorBugbotParser()
-
     def test_severity_in_larger_body(self, parser: CursorBugbotParser) -> None:
         """Test severity pattern embedded in larger body."""
         body = """
@@ -340,11 +287,6 @@ class TestCursorBugbotParserEdgeCases:
 class TestCursorBugbotParserSummaryComments:
     """Tests for PR-level summary comment classification."""
 
-    @pytest.fixture
-    def parser(self) -> CursorBugbotParser:
-        """Create a CursorBugbotParser instance."""
-        return CursorBugbotParser()
-
     def test_pr_summary_with_issues_found_is_non_actionable(
         self, parser: CursorBugbotParser
     ) -> None:
@@ -388,11 +330,6 @@ class TestCursorBugbotParserSummaryComments:
 class TestCursorBugbotParserThreadResolution:
     """Tests for thread resolution handling (base class template method)."""
 
-    @pytest.fixture
-    def parser(self) -> CursorBugbotParser:
-        """Create a CursorBugbotParser instance."""
-        return CursorBugbotParser()
-
     def test_resolved_thread_overrides_critical_severity(self, parser: CursorBugbotParser) -> None:
         """Test that resolved threads return NON_ACTIONABLE even with Critical Severity."""
         comment = {
@@ -11,15 +11,38 @@ import pytest
 from goodtogo.core.models import CommentClassification, Priority, ReviewerType
 from goodtogo.parsers.vercel import VercelParser
 
+DEPLOYMENT_SUCCESS_BODY = (
+    "The latest updates on your projects. "
+    "Learn more about Vercel for Git.\n\n"
+    "| Name | Status | Preview |\n"
+    "| :--- | :----- | :------ |\n"
+    "| **my-app** | Ready ([Inspect](https://vercel.com/...)) "
+    "| [Visit Preview](https://my-app-abc123.vercel.app) |"
+)
+DEPLOYMENT_FAILURE_BODY = (
+    "The latest updates on your projects.\n\n"
+    "| Name | Status | Preview |\n"
+    "| :--- | :----- | :------ |\n"
+    "| **my-app** | Failed ([Inspect](https://vercel.com/...)) | |"
+)
+DEPLOYMENT_PENDING_BODY = (
+    "The latest updates on your projects.\n\n"
+    "| Name | Status | Preview |\n"
+    "| :--- | :----- | :------ |\n"
+    "| **my-app** | Building ([Inspect](https://vercel.com/...)) | |"
+)
+DEPLOYMENT_CANCELLED_BODY = "[vc]: # (deployment-cancelled)\nThis deployment was cancelled."
+
+
+@pytest.fixture(scope="module")
+def parser(vercel_parser: VercelParser) -> VercelParser:
+    """Return the shared VercelParser from the parsers conftest."""
+    return vercel_parser
+
 
 class TestVercelParserCanParse:
     """Tests for VercelParser.can_parse() method."""
 
-    @pytest.fixture
-    def parser(self) -> VercelParser:
-        """Create a VercelParser instance."""
-        return VercelParser()
-
     def test_can_parse_by_author_exact_match(self, parser: VercelParser) -> None:
         """Test detection by exact author match."""
         assert parser.can_parse("vercel[bot]", "") is True
@@ -44,11 +67,6 @@ class TestVercelParserCanParse:
         body = "Preview: https://my-app-abc123.vercel.app"
         assert parser.can_parse("other-user", body) is True
 
-    def test_can_parse_by_body_preview_bold(self, parser: VercelParser) -> None:
-        """Test detection by **Preview** marker in deployment table."""
-        body = "| **Preview** | https://my-app.vercel.app |"
-        assert parser.can_parse("other-user", body) is True
-
     def test_can_parse_by_body_case_insensitive(self, parser: VercelParser) -> None:
         """Test that body signature detection is case-insensitive."""
         assert parser.can_parse("other", "Check VERCEL.COM") is True
@@ -59,12 +77,36 @@ class TestVercelParserCanParse:
         assert parser.can_parse("random-user", "") is False
         assert parser.can_parse("github-bot", "") is False
         assert parser.can_parse("", "") is False
+        assert parser.can_parse("vercel[bot]-fork", "") is False
+        assert parser.can_parse("zercel[bot]", "") is False
 
     def test_can_parse_non_matching_body(self, parser: VercelParser) -> None:
         """Test that non-matching bodies are rejected."""
         assert parser.can_parse("random-user", "Regular comment body") is False
         assert parser.can_parse("random-user", "Some other deployment tool") is False
 
+    @pytest.mark.parametrize(
+        "body",
+        [
+            pytest.param(
+                "The fix works on my-app-abc123.vercel.app, but the header still overlaps.",
+                id="bare-vercel-app-host",
+            ),
+            pytest.param(
+                "See https://example.com/docs?ref=my-app.vercel.app for the repro.",
+                id="vercel-app-outside-url-host",
+            ),
+            pytest.param("**Preview** mode loses the sidebar state.", id="bold-preview"),
+            pytest.param(
+                "see https://foo.vercel.app.evil.com/x", id="vercel-app-followed-by-other-domain"
+            ),
+            pytest.param("https://my.vercel.application.io", id="vercel-app-as-label-prefix"),
+        ],
+    )
+    def test_can_parse_rejects_human_mentions(self, parser: VercelParser, body: str) -> None:
+        """Test that human comments merely mentioning a preview are not claimed."""
+        assert parser.can_parse("human-reviewer", body) is False
+
 
 class TestVercelParserReviewerType:
     """Tests for VercelParser.reviewer_type property."""
@@ -74,6 +116,10 @@ class TestVercelParserReviewerType:
         parser = VercelParser()
         assert parser.reviewer_type == ReviewerType.VERCEL
 
+    def test_has_no_instance_dict(self, parser: VercelParser) -> None:
+        """Test the parser declares empty __slots__ all the way up its bases."""
+        assert not hasattr(parser, "__dict__")
+
 
 class TestVercelParserClassification:
     """Tests for Vercel comment classification.
@@ -82,104 +128,38 @@ class TestVercelParserClassification:
     deployment status notifications, not code review feedback.
     """
 
-    @pytest.fixture
-    def parser(self) -> VercelParser:
-        """Create a VercelParser instance."""
-        return VercelParser()
-
-    def test_deployment_success_is_non_actionable(self, parser: VercelParser) -> None:
-        """Test deployment success comment is NON_ACTIONABLE."""
-        body = (
-            "The latest updates on your projects. "
-            "Learn more about Vercel for Git.\n\n"
-            "| Name | Status | Preview |\n"
-            "| :--- | :----- | :------ |\n"
-            "| **my-app** | Ready ([Inspect](https://vercel.com/...)) "
-            "| [Visit Preview](https://my-app-abc123.vercel.app) |"
-        )
-        comment = {"body": body}
+    @pytest.mark.parametrize(
+        "comment",
+        [
+            pytest.param({"body": DEPLOYMENT_SUCCESS_BODY}, id="deployment-success"),
+            pytest.param({"body": DEPLOYMENT_FAILURE_BODY}, id="deployment-failure"),
+            pytest.param({"body": DEPLOYMENT_PENDING_BODY}, id="deployment-pending"),
+            pytest.param({"body": DEPLOYMENT_CANCELLED_BODY}, id="deployment-cancelled"),
+            pytest.param({"body": ""}, id="empty-body"),
+            pytest.param({}, id="missing-body"),
+            pytest.param({"body": "Some unexpected Vercel message format."}, id="arbitrary-text"),
+        ],
+    )
+    def test_comment_is_non_actionable(self, parser: VercelParser, comment: dict) -> None:
+        """Test every Vercel comment is NON_ACTIONABLE with TRIVIAL priority."""
         classification, priority, requires_investigation = parser.parse(comment)
 
         assert classification == CommentClassification.NON_ACTIONABLE
         assert priority == Priority.TRIVIAL
         assert requires_investigation is False
 
-    def test_deployment_failure_is_non_actionable(self, parser: VercelParser) -> None:
-        """Test deployment failure comment is NON_ACTIONABLE."""
-        body = (
-            "The latest updates on your projects.\n\n"
-            "| Name | Status | Preview |\n"
-            "| :--- | :----- | :------ |\n"
-            "| **my-app** | Failed ([Inspect](https://vercel.com/...)) | |"
-        )
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
+    def test_parse_returns_shared_result(self, parser: VercelParser) -> None:
+        """Test open comments all return the same preallocated result tuple."""
+        first = parser.parse({"body": DEPLOYMENT_SUCCESS_BODY})
+        second = parser.parse({"body": DEPLOYMENT_FAILURE_BODY})
 
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.TRIVIAL
-        assert requires_investigation is False
-
-    def test_deployment_pending_is_non_actionable(self, parser: VercelParser) -> None:
-        """Test deployment pending/building comment is NON_ACTIONABLE."""
-        body = (
-            "The latest updates on your projects.\n\n"
-            "| Name | Status | Preview |\n"
-            "| :--- | :----- | :------ |\n"
-            "| **my-app** | Building ([Inspect](https://vercel.com/...)) | |"
-        )
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.TRIVIAL
-        assert requires_investigation is False
-
-    def test_deployment_cancelled_is_non_actionable(self, parser: VercelParser) -> None:
-        """Test deployment cancelled comment is NON_ACTIONABLE."""
-        body = "[vc]: # (deployment-cancelled)\n" "This deployment was cancelled."
-        comment = {"body": body}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.TRIVIAL
-        assert requires_investigation is False
-
-    def test_empty_body_is_non_actionable(self, parser: VercelParser) -> None:
-        """Test empty body is still NON_ACTIONABLE for Vercel."""
-        comment = {"body": ""}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.TRIVIAL
-        assert requires_investigation is False
-
-    def test_missing_body_is_non_actionable(self, parser: VercelParser) -> None:
-        """Test missing body key is still NON_ACTIONABLE for Vercel."""
-        comment = {}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.TRIVIAL
-        assert requires_investigation is False
-
-    def test_arbitrary_text_is_non_actionable(self, parser: VercelParser) -> None:
-        """Test any arbitrary text from Vercel is NON_ACTIONABLE."""
-        comment = {"body": "Some unexpected Vercel message format."}
-        classification, priority, requires_investigation = parser.parse(comment)
-
-        assert classification == CommentClassification.NON_ACTIONABLE
-        assert priority == Priority.TRIVIAL
-        assert requires_investigation is False
+        assert first is VercelParser.NON_ACTIONABLE_RESULT
+        assert second is first
 
 
 class TestVercelParserThreadResolution:
     """Tests for thread resolution handling (base class template method)."""
 
-    @pytest.fixture
-    def parser(self) -> VercelParser:
-        """Create a VercelParser instance."""
-        return VercelParser()
-
     def test_resolved_thread_is_non_actionable(self, parser: VercelParser) -> None:
         """Test that resolved threads return NON_ACTIONABLE."""
         comment = {
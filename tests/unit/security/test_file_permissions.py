@@ -10,232 +10,180 @@ from __future__ import annotations
 
 import os
 import stat
-import tempfile
+import warnings
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from goodtogo.adapters.cache_sqlite import SqliteCacheAdapter
 
+pytestmark = pytest.mark.slow
+
 
 class TestSQLiteCacheFilePermissions:
     """Verify cache files have secure permissions (0600)."""
 
-    def test_new_cache_file_has_0600_permissions(self) -> None:
+    def test_new_cache_file_has_0600_permissions(self, tmp_path: Path) -> None:
         """New cache file must be created with 0600 (owner rw only)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_path = os.path.join(tmpdir, "cache.db")
-            cache = SqliteCacheAdapter(cache_path)
-            cache.set("test", "value", ttl_seconds=60)
+        cache_path = os.path.join(tmp_path, "cache.db")
+        cache = SqliteCacheAdapter(cache_path)
+        cache.set("test", "value", ttl_seconds=60)
 
-            # Check permissions
-            mode = os.stat(cache_path).st_mode
-            # Extract permission bits
-            perms = stat.S_IMODE(mode)
-            assert perms == 0o600, f"Expected 0600, got {oct(perms)}"
+        # Check permissions
+        mode = os.stat(cache_path).st_mode
+        # Extract permission bits
+        perms = stat.S_IMODE(mode)
+        assert perms == 0o600, f"Expected 0600, got {oct(perms)}"
 
-            cache.close()
+        cache.close()
 
-    def test_cache_file_permissions_after_get(self) -> None:
+    def test_cache_file_permissions_after_get(self, tmp_path: Path) -> None:
         """Cache file should maintain 0600 permissions after read operations."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_path = os.path.join(tmpdir, "cache.db")
-            cache = SqliteCacheAdapter(cache_path)
-            cache.set("key", "value", ttl_seconds=300)
-            cache.get("key")
-            cache.get("nonexistent")
+        cache_path = os.path.join(tmp_path, "cache.db")
+        cache = SqliteCacheAdapter(cache_path)
+        cache.set("key", "value", ttl_seconds=300)
+        cache.get("key")
+        cache.get("nonexistent")
+
+        mode = os.stat(cache_path).st_mode
+        perms = stat.S_IMODE(mode)
+        assert perms == 0o600, f"Expected 0600, got {oct(perms)}"
+
+        cache.close()
+
+    def test_new_cache_file_is_0600_under_permissive_umask(self, tmp_path: Path) -> None:
+        """A new cache file must not inherit a permissive umask, and not warn."""
+        cache_path = os.path.join(tmp_path, "cache.db")
+        old_umask = os.umask(0)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                cache = SqliteCacheAdapter(cache_path)
+        finally:
+            os.umask(old_umask)
 
-            mode = os.stat(cache_path).st_mode
-            perms = stat.S_IMODE(mode)
-            assert perms == 0o600, f"Expected 0600, got {oct(perms)}"
+        perms = stat.S_IMODE(os.stat(cache_path).st_mode)
+        assert perms == 0o600, f"Expected 0600, got {oct(perms)}"
 
-            cache.close()
+        cache.close()
 
 
 class TestSQLiteCacheDirectoryPermissions:
     """Verify cache directories have secure permissions (0700)."""
 
-    def test_cache_directory_has_0700_permissions(self) -> None:
+    def test_cache_directory_has_0700_permissions(self, tmp_path: Path) -> None:
         """Cache directory must be created with 0700."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_dir = os.path.join(tmpdir, "subdir", "cache")
-            cache_path = os.path.join(cache_dir, "cache.db")
-            cache = SqliteCacheAdapter(cache_path)
-            cache.set("test", "value", ttl_seconds=60)
+        cache_dir = os.path.join(tmp_path, "subdir", "cache")
+        cache_path = os.path.join(cache_dir, "cache.db")
+        cache = SqliteCacheAdapter(cache_path)
+        cache.set("test", "value", ttl_seconds=60)
 
-            # Check directory permissions
-            mode = os.stat(cache_dir).st_mode
-            perms = stat.S_IMODE(mode)
-            assert perms == 0o700, f"Expected 0700, got {oct(perms)}"
+        # Check directory permissions
+        mode = os.stat(cache_dir).st_mode
+        perms = stat.S_IMODE(mode)
+        assert perms == 0o700, f"Expected 0700, got {oct(perms)}"
 
-            cache.close()
+        cache.close()
 
-    def test_nested_directory_creation_permissions(self) -> None:
+    def test_nested_directory_creation_permissions(self, tmp_path: Path) -> None:
         """Nested directories should all be created with secure permissions."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create deeply nested path
-            cache_path = os.path.join(tmpdir, "a", "b", "c", "cache.db")
+        # Create deeply nested path
+        cache_path = os.path.join(tmp_path, "a", "b", "c", "cache.db")
+        cache = SqliteCacheAdapter(cache_path)
+        cache.set("test", "value", ttl_seconds=60)
+
+        # Check the immediate parent directory (where cache.db lives)
+        immediate_parent = os.path.dirname(cache_path)
+        mode = os.stat(immediate_parent).st_mode
+        perms = stat.S_IMODE(mode)
+        assert perms == 0o700, f"Expected 0700, got {oct(perms)}"
+
+        cache.close()
+
+    def test_intermediate_directories_created_0700(self, tmp_path: Path) -> None:
+        """Intermediate directories created for the cache must also be 0700."""
+        cache_path = os.path.join(tmp_path, "a", "b", "c", "cache.db")
+        old_umask = os.umask(0o022)
+        try:
             cache = SqliteCacheAdapter(cache_path)
-            cache.set("test", "value", ttl_seconds=60)
+        finally:
+            os.umask(old_umask)
 
-            # Check the immediate parent directory (where cache.db lives)
-            immediate_parent = os.path.dirname(cache_path)
-            mode = os.stat(immediate_parent).st_mode
-            perms = stat.S_IMODE(mode)
-            assert perms == 0o700, f"Expected 0700, got {oct(perms)}"
-
-            cache.close()
+        for subdir in ("a", "a/b", "a/b/c"):
+            perms = stat.S_IMODE(os.stat(os.path.join(tmp_path, subdir)).st_mode)
+            assert perms == 0o700, f"{subdir}: expected 0700, got {oct(perms)}"
 
+        cache.close()
 
-class TestExistingPermissiveCacheFile:
-    """Verify permissive existing files get fixed."""
-
-    def test_existing_permissive_file_gets_restricted(self) -> None:
-        """If file exists with loose perms, must be tightened."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_path = os.path.join(tmpdir, "cache.db")
-            # Create file with permissive permissions
-            with open(cache_path, "w") as f:
-                f.write("")
-            os.chmod(cache_path, 0o666)
-
-            # Verify it's permissive before
-            mode_before = os.stat(cache_path).st_mode
-            assert stat.S_IMODE(mode_before) == 0o666
-
-            # Open cache - should fix permissions
+    def test_directory_creation_leaves_umask_alone(self, tmp_path: Path) -> None:
+        """The process-wide umask must not be changed, even temporarily."""
+        cache_path = os.path.join(tmp_path, "a", "b", "cache.db")
+        with patch("goodtogo.adapters.cache_sqlite.os.umask") as mock_umask:
             cache = SqliteCacheAdapter(cache_path)
 
-            # Verify permissions were fixed
-            mode = os.stat(cache_path).st_mode
-            perms = stat.S_IMODE(mode)
-            assert perms == 0o600, f"Expected 0600, got {oct(perms)}"
-
-            cache.close()
-
-    def test_group_readable_file_gets_restricted(self) -> None:
-        """File with group read permission should be restricted."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_path = os.path.join(tmpdir, "cache.db")
-            with open(cache_path, "w") as f:
-                f.write("")
-            os.chmod(cache_path, 0o640)  # Group readable
-
-            with pytest.warns(UserWarning, match="permissive"):
-                cache = SqliteCacheAdapter(cache_path)
-
-            mode = os.stat(cache_path).st_mode
-            perms = stat.S_IMODE(mode)
-            assert perms == 0o600
-
-            cache.close()
-
-    def test_world_readable_file_gets_restricted(self) -> None:
-        """File with world read permission should be restricted."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_path = os.path.join(tmpdir, "cache.db")
-            with open(cache_path, "w") as f:
-                f.write("")
-            os.chmod(cache_path, 0o644)  # World readable
-
-            with pytest.warns(UserWarning, match="permissive"):
-                cache = SqliteCacheAdapter(cache_path)
-
-            mode = os.stat(cache_path).st_mode
-            perms = stat.S_IMODE(mode)
-            assert perms == 0o600
+        mock_umask.assert_not_called()
+        cache.close()
 
-            cache.close()
-
-    def test_world_writable_file_gets_restricted(self) -> None:
-        """File with world write permission should be restricted."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_path = os.path.join(tmpdir, "cache.db")
-            with open(cache_path, "w") as f:
-                f.write("")
-            os.chmod(cache_path, 0o622)  # World writable
-
-            with pytest.warns(UserWarning, match="permissive"):
-                cache = SqliteCacheAdapter(cache_path)
-
-            mode = os.stat(cache_path).st_mode
-            perms = stat.S_IMODE(mode)
-            assert perms == 0o600
-
-            cache.close()
 
+class TestExistingPermissiveCacheFile:
+    """Verify permissive existing files get fixed, with a warning."""
+
+    @pytest.mark.parametrize(
+        "initial_mode",
+        [
+            pytest.param(0o666, id="world-read-write"),
+            pytest.param(0o640, id="group-readable"),
+            pytest.param(0o644, id="world-readable"),
+            pytest.param(0o622, id="world-writable"),
+            pytest.param(0o660, id="group-writable"),
+            pytest.param(0o777, id="very-permissive"),
+        ],
+    )
+    def test_existing_permissive_file_gets_restricted(
+        self, tmp_path: Path, initial_mode: int
+    ) -> None:
+        """If file exists with loose perms, must be tightened and warn with the old mode."""
+        cache_path = os.path.join(tmp_path, "cache.db")
+        Path(cache_path).touch()
+        os.chmod(cache_path, initial_mode)
+        assert stat.S_IMODE(os.stat(cache_path).st_mode) == initial_mode
+
+        with pytest.warns(UserWarning, match=rf"permissive permissions \({oct(initial_mode)}\)"):
+            cache = SqliteCacheAdapter(cache_path)
 
-class TestPermissionWarnings:
-    """Verify warnings are issued for world-readable files."""
-
-    def test_permission_warning_logged_for_world_readable(self) -> None:
-        """Log warning if file was world-readable before fix."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_path = os.path.join(tmpdir, "cache.db")
-            with open(cache_path, "w") as f:
-                f.write("")
-            os.chmod(cache_path, 0o644)  # World readable
-
-            with pytest.warns(UserWarning, match="permissive"):
-                cache = SqliteCacheAdapter(cache_path)
-                cache.close()
+        perms = stat.S_IMODE(os.stat(cache_path).st_mode)
+        assert perms == 0o600, f"Expected 0600, got {oct(perms)}"
 
-    def test_permission_warning_includes_old_permissions(self) -> None:
-        """Warning message should include the old permission value."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_path = os.path.join(tmpdir, "cache.db")
-            with open(cache_path, "w") as f:
-                f.write("")
-            os.chmod(cache_path, 0o777)  # Very permissive
+        cache.close()
 
-            with pytest.warns(UserWarning, match=r"0o777"):
-                cache = SqliteCacheAdapter(cache_path)
-                cache.close()
-
-    def test_no_warning_for_secure_existing_file(self) -> None:
+    def test_no_warning_for_secure_existing_file(self, tmp_path: Path) -> None:
         """No warning should be issued if existing file already has 0600."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_path = os.path.join(tmpdir, "cache.db")
-            with open(cache_path, "w") as f:
-                f.write("")
-            os.chmod(cache_path, 0o600)  # Already secure
-
-            # Should not warn
-            import warnings
-
-            with warnings.catch_warnings():
-                warnings.simplefilter("error")
-                cache = SqliteCacheAdapter(cache_path)
-                cache.close()
+        cache_path = os.path.join(tmp_path, "cache.db")
+        Path(cache_path).touch()
+        os.chmod(cache_path, 0o600)  # Already secure
 
-    def test_warning_for_group_writable(self) -> None:
-        """Warning should be issued for group-writable files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_path = os.path.join(tmpdir, "cache.db")
-            with open(cache_path, "w") as f:
-                f.write("")
-            os.chmod(cache_path, 0o660)  # Group writable
-
-            with pytest.warns(UserWarning, match="permissive"):
-                cache = SqliteCacheAdapter(cache_path)
-                cache.close()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            cache = SqliteCacheAdapter(cache_path)
+            cache.close()
 
 
 class TestDirectoryPermissionFixes:
     """Verify existing directories with wrong permissions get fixed."""
 
-    def test_existing_permissive_directory_gets_fixed(self) -> None:
+    def test_existing_permissive_directory_gets_fixed(self, tmp_path: Path) -> None:
         """If directory exists with loose perms, should be tightened."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_dir = os.path.join(tmpdir, "cache_subdir")
-            os.makedirs(cache_dir, mode=0o755)  # World readable/executable
+        cache_dir = os.path.join(tmp_path, "cache_subdir")
+        os.makedirs(cache_dir, mode=0o755)  # World readable/executable
 
-            cache_path = os.path.join(cache_dir, "cache.db")
-            cache = SqliteCacheAdapter(cache_path)
-            cache.set("test", "value", ttl_seconds=60)
+        cache_path = os.path.join(cache_dir, "cache.db")
+        cache = SqliteCacheAdapter(cache_path)
+        cache.set("test", "value", ttl_seconds=60)
 
-            # Check directory permissions were fixed
-            mode = os.stat(cache_dir).st_mode
-            perms = stat.S_IMODE(mode)
-            assert perms == 0o700, f"Expected 0700, got {oct(perms)}"
+        # Check directory permissions were fixed
+        mode = os.stat(cache_dir).st_mode
+        perms = stat.S_IMODE(mode)
+        assert perms == 0o700, f"Expected 0700, got {oct(perms)}"
 
-            cache.close()
+        cache.close()
@@ -8,46 +8,53 @@ Coverage target: 100% branch coverage on all token handling.
 
 from __future__ import annotations
 
+import pickle
+
 import pytest
 
 from goodtogo.adapters.github import GitHubAdapter
 from goodtogo.core.errors import RedactedError, redact_error
 
+SECRET_TOKEN = "ghp_secret123456789"
+
+
+@pytest.fixture(scope="module")
+def secret_adapter() -> GitHubAdapter:
+    """Return one GitHubAdapter holding SECRET_TOKEN; tests only inspect it."""
+    return GitHubAdapter(token=SECRET_TOKEN)
+
 
 class TestGitHubAdapterTokenProtection:
     """Verify tokens never leak through repr/str."""
 
-    def test_repr_redacts_token(self) -> None:
+    def test_repr_redacts_token(self, secret_adapter: GitHubAdapter) -> None:
         """GitHubAdapter __repr__ must not expose the token."""
-        adapter = GitHubAdapter(token="ghp_secret123456789")
-        repr_output = repr(adapter)
-        assert "ghp_secret123456789" not in repr_output
+        repr_output = repr(secret_adapter)
+        assert SECRET_TOKEN not in repr_output
         assert "<redacted>" in repr_output.lower()
 
-    def test_str_redacts_token(self) -> None:
+    def test_str_redacts_token(self, secret_adapter: GitHubAdapter) -> None:
         """GitHubAdapter __str__ must not expose the token."""
-        adapter = GitHubAdapter(token="ghp_secret123456789")
-        str_output = str(adapter)
-        assert "ghp_secret123456789" not in str_output
+        str_output = str(secret_adapter)
+        assert SECRET_TOKEN not in str_output
         assert "<redacted>" in str_output.lower()
 
-    def test_token_not_in_public_attributes(self) -> None:
+    def test_token_not_in_public_attributes(self, secret_adapter: GitHubAdapter) -> None:
         """Token should only be in private attribute _token."""
-        adapter = GitHubAdapter(token="ghp_secret123456789")
         # The token should be stored in _token (private)
         # Verify it's not accidentally exposed elsewhere
-        public_attrs = [attr for attr in dir(adapter) if not attr.startswith("_")]
+        public_attrs = [attr for attr in dir(secret_adapter) if not attr.startswith("_")]
         for attr in public_attrs:
-            attr_val = getattr(adapter, attr)
+            attr_val = getattr(secret_adapter, attr)
             if isinstance(attr_val, str):
-                assert "ghp_secret123456789" not in attr_val
+                assert SECRET_TOKEN not in attr_val
 
-    def test_different_token_formats_redacted_in_repr(self) -> None:
+    @pytest.mark.parametrize("token", ["ghp_abc123", "gho_xyz789", "github_pat_ABC123_def"])
+    def test_different_token_formats_redacted_in_repr(self, token: str) -> None:
         """All GitHub token formats should be hidden in repr."""
-        for token in ["ghp_abc123", "gho_xyz789", "github_pat_ABC123_def"]:
-            adapter = GitHubAdapter(token=token)
-            assert token not in repr(adapter)
-            assert token not in str(adapter)
+        adapter = GitHubAdapter(token=token)
+        assert token not in repr(adapter)
+        assert token not in str(adapter)
 
 
 class TestErrorRedaction:
@@ -171,6 +178,20 @@ class TestErrorRedaction:
         assert "gho_secret456" in str(redacted.original)  # Original has it
         assert "gho_secret456" not in str(redacted)  # Redacted doesn't
 
+    def test_redacted_error_has_no_instance_dict(self) -> None:
+        """RedactedError stores .original in a slot rather than a __dict__."""
+        redacted = redact_error(ValueError("ghp_secret123 is invalid"))
+        assert "original" not in getattr(redacted, "__dict__", {})
+        assert "original" in RedactedError.__slots__
+
+    def test_redacted_error_pickle_keeps_original(self) -> None:
+        """Pickling a RedactedError should keep the message and the original."""
+        redacted = redact_error(ValueError("ghp_secret123 is invalid"))
+        restored = pickle.loads(pickle.dumps(redacted))
+        assert str(restored) == str(redacted)
+        assert isinstance(restored.original, ValueError)
+        assert str(restored.original) == "ghp_secret123 is invalid"
+
     def test_redacted_error_is_exception(self) -> None:
         """RedactedError should be an Exception subclass."""
         redacted = redact_error(Exception("test"))
@@ -6,6 +6,8 @@ including cache creation for different backends.
 
 from __future__ import annotations
 
+import sys
+import types
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
@@ -20,6 +22,37 @@ from goodtogo.container import (
 )
 from goodtogo.core.models import ReviewerType
 
+# Reviewer types every default parser registry must cover
+EXPECTED_REVIEWER_TYPES = frozenset(
+    {
+        ReviewerType.CODERABBIT,
+        ReviewerType.GREPTILE,
+        ReviewerType.CLAUDE,
+        ReviewerType.CURSOR,
+        ReviewerType.HUMAN,
+        ReviewerType.UNKNOWN,
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def module_cache_path(tmp_path_factory):
+    """Return a SQLite cache path in a directory created once per module."""
+    return str(tmp_path_factory.mktemp("cache") / "test_cache.db")
+
+
+@pytest.fixture(scope="module")
+def default_parsers():
+    """Build the default parser dict once; the tests below only read it."""
+    return _create_default_parsers()
+
+
+@pytest.fixture(scope="module")
+def default_test_container():
+    """Build one default test container for the read-only assertions."""
+    return Container.create_for_testing()
+
+
 # ============================================================================
 # Test: MockGitHubAdapter String Representations
 # ============================================================================
@@ -52,45 +85,38 @@ class TestMockGitHubAdapterMethods:
     def test_get_pr_raises_not_implemented(self):
         """get_pr should raise NotImplementedError with helpful message."""
         adapter = MockGitHubAdapter()
-        with pytest.raises(NotImplementedError) as exc_info:
+        with pytest.raises(NotImplementedError, match=r"(?i:not implemented).*Replace with a mock"):
             adapter.get_pr("owner", "repo", 123)
-        assert "not implemented" in str(exc_info.value).lower()
-        assert "Replace with a mock" in str(exc_info.value)
 
     def test_get_pr_comments_raises_not_implemented(self):
         """get_pr_comments should raise NotImplementedError."""
         adapter = MockGitHubAdapter()
-        with pytest.raises(NotImplementedError) as exc_info:
+        with pytest.raises(NotImplementedError, match="(?i)not implemented"):
             adapter.get_pr_comments("owner", "repo", 123)
-        assert "not implemented" in str(exc_info.value).lower()
 
     def test_get_pr_reviews_raises_not_implemented(self):
         """get_pr_reviews should raise NotImplementedError."""
         adapter = MockGitHubAdapter()
-        with pytest.raises(NotImplementedError) as exc_info:
+        with pytest.raises(NotImplementedError, match="(?i)not implemented"):
             adapter.get_pr_reviews("owner", "repo", 123)
-        assert "not implemented" in str(exc_info.value).lower()
 
     def test_get_pr_threads_raises_not_implemented(self):
         """get_pr_threads should raise NotImplementedError."""
         adapter = MockGitHubAdapter()
-        with pytest.raises(NotImplementedError) as exc_info:
+        with pytest.raises(NotImplementedError, match="(?i)not implemented"):
             adapter.get_pr_threads("owner", "repo", 123)
-        assert "not implemented" in str(exc_info.value).lower()
 
     def test_get_ci_status_raises_not_implemented(self):
         """get_ci_status should raise NotImplementedError."""
         adapter = MockGitHubAdapter()
-        with pytest.raises(NotImplementedError) as exc_info:
+        with pytest.raises(NotImplementedError, match="(?i)not implemented"):
             adapter.get_ci_status("owner", "repo", "abc123")
-        assert "not implemented" in str(exc_info.value).lower()
 
     def test_get_commit_raises_not_implemented(self):
         """get_commit should raise NotImplementedError."""
         adapter = MockGitHubAdapter()
-        with pytest.raises(NotImplementedError) as exc_info:
+        with pytest.raises(NotImplementedError, match="(?i)not implemented"):
             adapter.get_commit("owner", "repo", "abc123")
-        assert "not implemented" in str(exc_info.value).lower()
 
 
 # ============================================================================
@@ -101,44 +127,49 @@ class TestMockGitHubAdapterMethods:
 class TestContainerCreateDefault:
     """Tests for Container.create_default() factory method."""
 
-    def test_create_default_with_sqlite_cache(self, tmp_path):
-        """create_default should create container with SQLite cache."""
-        cache_path = str(tmp_path / "cache.db")
+    @pytest.fixture
+    def mock_github(self):
+        """Patch the GitHubAdapter class used by create_default.
 
+        Calling the patched class returns its auto-created ``return_value``
+        mock, so no separate instance mock is built per test.
+        """
         with patch("goodtogo.container.GitHubAdapter") as mock_github:
-            mock_github.return_value = MagicMock()
+            yield mock_github
 
-            container = Container.create_default(
-                github_token="ghp_test_token",
-                cache_type="sqlite",
-                cache_path=cache_path,
-            )
+    @pytest.mark.slow
+    def test_create_default_with_sqlite_cache(self, mock_github, tmp_path):
+        """create_default should create container with SQLite cache."""
+        cache_path = str(tmp_path / "cache.db")
+
+        container = Container.create_default(
+            github_token="ghp_test_token",
+            cache_type="sqlite",
+            cache_path=cache_path,
+        )
 
         assert container.github is not None
         assert isinstance(container.cache, SqliteCacheAdapter)
         assert container.parsers is not None
 
-    def test_create_default_with_redis_cache(self):
+    def test_create_default_with_redis_cache(self, mock_github):
         """create_default should create container with Redis cache when configured."""
         # Create a mock Redis cache adapter
         mock_redis_adapter = MagicMock()
 
-        with patch("goodtogo.container.GitHubAdapter") as mock_github:
-            mock_github.return_value = MagicMock()
-
-            # Mock the Redis import and class
-            with patch.dict(
-                "sys.modules",
-                {"goodtogo.adapters.cache_redis": MagicMock()},
-            ):
-                with patch("goodtogo.container._create_cache") as mock_create_cache:
-                    mock_create_cache.return_value = mock_redis_adapter
-
-                    container = Container.create_default(
-                        github_token="ghp_test_token",
-                        cache_type="redis",
-                        redis_url="redis://localhost:6379",
-                    )
+        # Mock the Redis import and class
+        with patch.dict(
+            "sys.modules",
+            {"goodtogo.adapters.cache_redis": MagicMock()},
+        ):
+            with patch("goodtogo.container._create_cache") as mock_create_cache:
+                mock_create_cache.return_value = mock_redis_adapter
+
+                container = Container.create_default(
+                    github_token="ghp_test_token",
+                    cache_type="redis",
+                    redis_url="redis://localhost:6379",
+                )
 
         assert container is not None
         mock_create_cache.assert_called_once_with(
@@ -148,32 +179,27 @@ class TestContainerCreateDefault:
             ANY,  # time_provider
         )
 
-    def test_create_default_with_none_cache(self):
+    def test_create_default_with_none_cache(self, mock_github):
         """create_default should create container with no-op cache."""
-        with patch("goodtogo.container.GitHubAdapter") as mock_github:
-            mock_github.return_value = MagicMock()
-
-            container = Container.create_default(
-                github_token="ghp_test_token",
-                cache_type="none",
-            )
+        container = Container.create_default(
+            github_token="ghp_test_token",
+            cache_type="none",
+        )
 
         assert container.github is not None
         # "none" cache type uses InMemoryCacheAdapter as no-op
         assert isinstance(container.cache, InMemoryCacheAdapter)
 
-    def test_create_default_passes_token_to_github_adapter(self, tmp_path):
+    @pytest.mark.slow
+    def test_create_default_passes_token_to_github_adapter(self, mock_github, tmp_path):
         """create_default should pass token to GitHubAdapter."""
         cache_path = str(tmp_path / "cache.db")
 
-        with patch("goodtogo.container.GitHubAdapter") as mock_github:
-            mock_github.return_value = MagicMock()
-
-            Container.create_default(
-                github_token="ghp_my_secret_token",
-                cache_type="sqlite",
-                cache_path=cache_path,
-            )
+        Container.create_default(
+            github_token="ghp_my_secret_token",
+            cache_type="sqlite",
+            cache_path=cache_path,
+        )
 
         mock_github.assert_called_once_with(
             token="ghp_my_secret_token",
@@ -189,72 +215,51 @@ class TestContainerCreateDefault:
 class TestCreateCacheFunction:
     """Tests for the _create_cache() helper function."""
 
-    def test_create_cache_sqlite(self, tmp_path):
-        """_create_cache should create SqliteCacheAdapter for 'sqlite' type."""
-        cache_path = str(tmp_path / "test_cache.db")
-        cache = _create_cache("sqlite", cache_path, None)
-
-        assert isinstance(cache, SqliteCacheAdapter)
-
-    def test_create_cache_none_type(self):
-        """_create_cache should create InMemoryCacheAdapter for 'none' type."""
-        cache = _create_cache("none", "/unused/path", None)
-
-        # "none" type uses InMemoryCacheAdapter as a no-op cache
-        assert isinstance(cache, InMemoryCacheAdapter)
-
-    def test_create_cache_redis_requires_url(self):
-        """_create_cache should raise ValueError if redis_url missing for redis type."""
-        with pytest.raises(ValueError) as exc_info:
-            _create_cache("redis", "/unused/path", None)
-
-        assert "redis_url required" in str(exc_info.value)
-
-    def test_create_cache_redis_with_url(self):
+    @pytest.fixture
+    def mock_redis_module(self, monkeypatch):
+        """Install a stand-in goodtogo.adapters.cache_redis module for one test."""
+        module = types.ModuleType("goodtogo.adapters.cache_redis")
+        module.RedisCacheAdapter = MagicMock()
+        monkeypatch.setitem(sys.modules, "goodtogo.adapters.cache_redis", module)
+        return module
+
+    @pytest.mark.parametrize(
+        "cache_type, expected_cls",
+        [
+            pytest.param("sqlite", SqliteCacheAdapter, id="sqlite", marks=pytest.mark.slow),
+            # "none" uses InMemoryCacheAdapter as a no-op cache
+            pytest.param("none", InMemoryCacheAdapter, id="none"),
+        ],
+    )
+    def test_create_cache_returns_adapter(self, cache_type, expected_cls, module_cache_path):
+        """_create_cache should create the adapter matching the cache type."""
+        cache = _create_cache(cache_type, module_cache_path, None)
+
+        assert isinstance(cache, expected_cls)
+
+    @pytest.mark.parametrize(
+        "cache_type, match",
+        [
+            pytest.param("redis", "redis_url required", id="redis-without-url"),
+            pytest.param(
+                "invalid_cache_type",
+                "Unknown cache type: invalid_cache_type",
+                id="unknown-type",
+            ),
+            pytest.param("", "Unknown cache type", id="empty-type"),
+        ],
+    )
+    def test_create_cache_invalid_config_raises(self, cache_type, match):
+        """_create_cache should raise ValueError for unusable configurations."""
+        with pytest.raises(ValueError, match=match):
+            _create_cache(cache_type, "/unused/path", None)
+
+    def test_create_cache_redis_with_url(self, mock_redis_module):
         """_create_cache should import and create RedisCacheAdapter when redis_url provided."""
-        import sys
-
-        # Create a mock RedisCacheAdapter class
-        mock_redis_instance = MagicMock()
-        mock_redis_class = MagicMock(return_value=mock_redis_instance)
-
-        # Create a mock module with RedisCacheAdapter
-        mock_module = MagicMock()
-        mock_module.RedisCacheAdapter = mock_redis_class
+        result = _create_cache("redis", "/unused/path", "redis://localhost:6379")
 
-        # Inject the mock module before calling _create_cache
-        sys.modules["goodtogo.adapters.cache_redis"] = mock_module
-
-        try:
-            # Now call _create_cache which will import from the mocked module
-            result = _create_cache("redis", "/unused/path", "redis://localhost:6379")
-
-            # Verify the mock was called with the redis URL
-            mock_redis_class.assert_called_once_with("redis://localhost:6379")
-            assert result is mock_redis_instance
-        finally:
-            # Restore original modules
-            if "goodtogo.adapters.cache_redis" in sys.modules:
-                del sys.modules["goodtogo.adapters.cache_redis"]
-            # Also clear from the import cache
-            for key in list(sys.modules.keys()):
-                if "cache_redis" in key:
-                    del sys.modules[key]
-
-    def test_create_cache_invalid_type_raises_error(self):
-        """_create_cache should raise ValueError for unknown cache types."""
-        with pytest.raises(ValueError) as exc_info:
-            _create_cache("invalid_cache_type", "/path", None)
-
-        assert "Unknown cache type" in str(exc_info.value)
-        assert "invalid_cache_type" in str(exc_info.value)
-
-    def test_create_cache_empty_type_raises_error(self):
-        """_create_cache should raise ValueError for empty cache type string."""
-        with pytest.raises(ValueError) as exc_info:
-            _create_cache("", "/path", None)
-
-        assert "Unknown cache type" in str(exc_info.value)
+        mock_redis_module.RedisCacheAdapter.assert_called_once_with("redis://localhost:6379")
+        assert result is mock_redis_module.RedisCacheAdapter.return_value
 
 
 # ============================================================================
@@ -265,21 +270,17 @@ class TestCreateCacheFunction:
 class TestContainerCreateForTesting:
     """Tests for Container.create_for_testing() factory method."""
 
-    def test_create_for_testing_uses_mock_github(self):
+    def test_create_for_testing_uses_mock_github(self, default_test_container):
         """create_for_testing should use MockGitHubAdapter by default."""
-        container = Container.create_for_testing()
-
-        assert isinstance(container.github, MockGitHubAdapter)
+        assert isinstance(default_test_container.github, MockGitHubAdapter)
 
-    def test_create_for_testing_uses_memory_cache(self):
+    def test_create_for_testing_uses_memory_cache(self, default_test_container):
         """create_for_testing should use InMemoryCacheAdapter by default."""
-        container = Container.create_for_testing()
-
-        assert isinstance(container.cache, InMemoryCacheAdapter)
+        assert isinstance(default_test_container.cache, InMemoryCacheAdapter)
 
     def test_create_for_testing_accepts_custom_github(self):
         """create_for_testing should accept custom GitHub adapter."""
-        custom_github = MagicMock()
+        custom_github = object()  # only identity is checked
 
         container = Container.create_for_testing(github=custom_github)
 
@@ -287,22 +288,15 @@ class TestContainerCreateForTesting:
 
     def test_create_for_testing_accepts_custom_cache(self):
         """create_for_testing should accept custom cache adapter."""
-        custom_cache = MagicMock()
+        custom_cache = object()  # only identity is checked
 
         container = Container.create_for_testing(cache=custom_cache)
 
         assert container.cache is custom_cache
 
-    def test_create_for_testing_has_all_parsers(self):
+    def test_create_for_testing_has_all_parsers(self, default_test_container):
         """create_for_testing should include all default parsers."""
-        container = Container.create_for_testing()
-
-        assert ReviewerType.CODERABBIT in container.parsers
-        assert ReviewerType.GREPTILE in container.parsers
-        assert ReviewerType.CLAUDE in container.parsers
-        assert ReviewerType.CURSOR in container.parsers
-        assert ReviewerType.HUMAN in container.parsers
-        assert ReviewerType.UNKNOWN in container.parsers
+        assert EXPECTED_REVIEWER_TYPES <= default_test_container.parsers.keys()
 
 
 # ============================================================================
@@ -313,36 +307,18 @@ class TestContainerCreateForTesting:
 class TestCreateDefaultParsers:
     """Tests for the _create_default_parsers() helper function."""
 
-    def test_creates_all_reviewer_parsers(self):
-        """_create_default_parsers should create parsers for all reviewer types."""
-        parsers = _create_default_parsers()
-
-        # Should have entries for all known reviewer types
-        expected_types = [
-            ReviewerType.CODERABBIT,
-            ReviewerType.GREPTILE,
-            ReviewerType.CLAUDE,
-            ReviewerType.CURSOR,
-            ReviewerType.HUMAN,
-            ReviewerType.UNKNOWN,
-        ]
-
-        for reviewer_type in expected_types:
-            assert reviewer_type in parsers
-            assert parsers[reviewer_type] is not None
-
-    def test_parsers_have_can_parse_method(self):
-        """All parsers should have a can_parse method."""
-        parsers = _create_default_parsers()
-
-        for reviewer_type, parser in parsers.items():
-            assert hasattr(parser, "can_parse")
-            assert callable(parser.can_parse)
-
-    def test_parsers_have_parse_method(self):
-        """All parsers should have a parse method."""
-        parsers = _create_default_parsers()
-
-        for reviewer_type, parser in parsers.items():
-            assert hasattr(parser, "parse")
-            assert callable(parser.parse)
+    # Sorted so parametrize ids are stable across processes (xdist workers)
+    @pytest.mark.parametrize(
+        "reviewer_type",
+        sorted(EXPECTED_REVIEWER_TYPES, key=lambda reviewer_type: reviewer_type.value),
+        ids=lambda reviewer_type: reviewer_type.value,
+    )
+    def test_has_parser_for_reviewer_type(self, default_parsers, reviewer_type):
+        """_create_default_parsers should register a parser for each reviewer type."""
+        assert default_parsers.get(reviewer_type) is not None
+
+    def test_parsers_implement_protocol(self, default_parsers):
+        """All parsers should have callable can_parse and parse methods."""
+        for parser in default_parsers.values():
+            assert callable(getattr(parser, "can_parse", None))
+            assert callable(getattr(parser, "parse", None))